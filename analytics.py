@@ -2,18 +2,114 @@
 
 import logging
 import json
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from datetime import date, timedelta, datetime
 
-from PyQt5 import QtWidgets, QtCore
+try:
+    # orjson parses bill details several times faster than the stdlib parser.
+    from orjson import loads as json_loads
+except ImportError:
+    json_loads = json.loads
+
+import numpy as np
+from PyQt5 import QtWidgets, QtCore, QtGui
 from PyQt5.QtCore import Qt
 from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
 from matplotlib.figure import Figure
 import matplotlib.dates as mdates
+from sqlalchemy import func, insert
 
 # Import shared style definitions.
 from styles import BUTTON_STYLE, GROUPBOX_STYLE, HEADER_LABEL_STYLE
 
+# Month key shared by the SQL grouping and the chart's date axis.
+MONTH_FORMAT = '%Y-%m'
+
+class AnalyticsSignals(QtCore.QObject):
+    """Signals emitted by AnalyticsWorker; delivered on the GUI thread."""
+    finished = QtCore.pyqtSignal(int, object)
+    failed = QtCore.pyqtSignal(int, str)
+
+
+class AnalyticsWorker(QtCore.QRunnable):
+    """
+    Runs the analytics queries on a QThreadPool thread.
+    Emits `finished(request_id, result)` with plain Python data, or `failed(request_id, message)`.
+    """
+    def __init__(self, request_id, start_date, end_date):
+        super().__init__()
+        self.request_id = request_id
+        self.start_date = start_date
+        self.end_date = end_date
+        self.signals = AnalyticsSignals()
+
+    def run(self):
+        try:
+            # The three reads are independent, so each gets its own session and they overlap.
+            with ThreadPoolExecutor(max_workers=3) as executor:
+                revenue_future = executor.submit(self._fetch_revenue)
+                expenses_future = executor.submit(self._fetch_expenses)
+                inventory_future = executor.submit(self._fetch_inventory)
+                monthly_revenue, services_summary = revenue_future.result()
+                total_expenses = expenses_future.result()
+                inventory_list = inventory_future.result()
+            self.signals.finished.emit(self.request_id, {
+                "start_date": self.start_date,
+                "end_date": self.end_date,
+                "monthly_revenue": monthly_revenue,
+                "total_expenses": total_expenses,
+                "services_summary": services_summary,
+                "inventory_list": inventory_list,
+            })
+        except Exception as e:
+            logging.exception("Error querying analytics data")
+            self.signals.failed.emit(self.request_id, str(e))
+
+    def _fetch_revenue(self):
+        """Return (month, revenue) rows and the services sold within the date range."""
+        from main import session_scope, BillingRecord
+        bill_range = (BillingRecord.date >= self.start_date, BillingRecord.date <= self.end_date)
+        month_key = func.strftime(MONTH_FORMAT, BillingRecord.date)
+        with session_scope() as session:
+            # Let the database bucket revenue per month instead of hydrating every bill.
+            revenue_rows = (
+                session.query(month_key, func.sum(BillingRecord.total))
+                .filter(*bill_range)
+                .group_by(month_key)
+                .order_by(month_key)
+                .all()
+            )
+            monthly_revenue = [(month, revenue or 0.0) for month, revenue in revenue_rows]
+
+            services_summary = Counter()
+            for (details_json,) in session.query(BillingRecord.details).filter(*bill_range):
+                if details_json:
+                    services_summary.update(json_loads(details_json).get("services", {}))
+        return monthly_revenue, services_summary
+
+    def _fetch_expenses(self):
+        """Return the total expense amount within the date range."""
+        from main import session_scope, ExpenseRecord
+        with session_scope() as session:
+            return session.query(func.sum(ExpenseRecord.amount)).filter(
+                ExpenseRecord.date >= self.start_date,
+                ExpenseRecord.date <= self.end_date
+            ).scalar() or 0.0
+
+    def _fetch_inventory(self):
+        """Return (name, stock, selling price) for every inventory item."""
+        from main import session_scope, InventoryItem
+        with session_scope() as session:
+            inventory_items = session.query(InventoryItem).all()
+            return [
+                (item.item_name, item.stock_count, item.selling_price) for item in inventory_items
+            ]
+
+
 class AnalyticsTab(QtWidgets.QWidget):
+    _expense_insert = None  # Shared INSERT statement for ExpenseRecord, built on first use.
+
     def __init__(self, app, parent=None):
         super().__init__(parent)
         self.app = app
@@ -22,6 +118,14 @@ class AnalyticsTab(QtWidgets.QWidget):
             self._ = self.app._
         except Exception:
             self._ = lambda s: s
+        # Only the result of the most recent analytics request is shown.
+        self._analytics_request = 0
+        self._analytics_worker = None
+        self._last_result = None
+        # Chart rebuilds requested within one event-loop pass are collapsed into one.
+        self._redraw_pending = False
+        self._pending_chart = None
+        self._chart_stale = False
         self.init_ui()
 
     def init_ui(self):
@@ -77,6 +181,11 @@ class AnalyticsTab(QtWidgets.QWidget):
             self.expense_category.setPlaceholderText(self._("Expense Category (e.g., Rent, Salaries)"))
             self.expense_amount = QtWidgets.QLineEdit()
             self.expense_amount.setPlaceholderText(self._("Amount"))
+            # Reject non-numeric input while typing; the C locale keeps "." as the decimal point for float().
+            amount_validator = QtGui.QDoubleValidator(0.0, 1e12, 2, self.expense_amount)
+            amount_validator.setNotation(QtGui.QDoubleValidator.StandardNotation)
+            amount_validator.setLocale(QtCore.QLocale.c())
+            self.expense_amount.setValidator(amount_validator)
             self.expense_description = QtWidgets.QLineEdit()
             self.expense_description.setPlaceholderText(self._("Description (optional)"))
             self.add_expense_button = QtWidgets.QPushButton(self._("Add Expense"))
@@ -113,6 +222,12 @@ class AnalyticsTab(QtWidgets.QWidget):
             chart_layout = QtWidgets.QVBoxLayout(self.chart_group)
             self.figure = Figure(figsize=(6, 4))
             self.canvas = FigureCanvas(self.figure)
+            # Build the axes and artists once; redraws only swap their data.
+            self.ax = self.figure.add_subplot(111)
+            self.ax.xaxis_date()
+            self.ax.xaxis.set_major_formatter(mdates.DateFormatter(MONTH_FORMAT))
+            self._line, = self.ax.plot([], [], marker="o", linestyle="-")
+            self._bars = None
             chart_layout.addWidget(self.canvas)
 
             self.export_chart_btn = QtWidgets.QPushButton(self._("Export Chart"))
@@ -123,189 +238,237 @@ class AnalyticsTab(QtWidgets.QWidget):
 
             self.main_layout.addWidget(self.splitter)
 
-            # Refresh language settings (if needed)
-            self.refresh_language()
-
         except Exception as e:
             logging.exception("Error initializing Analytics UI")
             QtWidgets.QMessageBox.critical(self, self._("Error"), str(e))
 
     def update_analytics(self):
+        _ = self.app._
         try:
             # Validate date filter selection
             start_date = self.start_date_edit.date().toPyDate()
             end_date = self.end_date_edit.date().toPyDate()
             if start_date > end_date:
                 QtWidgets.QMessageBox.critical(
-                    self, self.app._("Error"), self.app._("Start date cannot be after end date.")
+                    self, _("Error"), _("Start date cannot be after end date.")
                 )
                 return
 
-            # Query billing, expense, and inventory data
-            from main import session_scope, BillingRecord, ExpenseRecord, InventoryItem
-            with session_scope() as session:
-                bills = session.query(BillingRecord).filter(
-                    BillingRecord.date >= start_date,
-                    BillingRecord.date <= end_date
-                ).all()
-                bill_data = [(bill.date, bill.total) for bill in bills]
-
-                services_summary = {}
-                for bill in bills:
-                    if bill.details:
-                        details = json.loads(bill.details)
-                        for svc, count in details.get("services", {}).items():
-                            services_summary[svc] = services_summary.get(svc, 0) + count
-
-                expenses = session.query(ExpenseRecord).filter(
-                    ExpenseRecord.date >= start_date,
-                    ExpenseRecord.date <= end_date
-                ).all()
-                total_expenses = sum(e.amount for e in expenses)
-
-                inventory_items = session.query(InventoryItem).all()
-                inventory_list = [
-                    (item.item_name, item.stock_count, item.selling_price) for item in inventory_items
-                ]
-
-            total_revenue = sum(total for _date, total in bill_data)
+            # Query on the thread pool so the GUI keeps painting; results arrive via signals.
+            self._analytics_request += 1
+            worker = AnalyticsWorker(self._analytics_request, start_date, end_date)
+            worker.signals.finished.connect(self._on_analytics_loaded)
+            worker.signals.failed.connect(self._on_analytics_failed)
+            self._analytics_worker = worker
+            self.apply_filters_button.setEnabled(False)
+            QtCore.QThreadPool.globalInstance().start(worker)
+        except Exception as e:
+            logging.exception("Error updating analytics")
+            QtWidgets.QMessageBox.critical(self, _("Error"), str(e))
+
+    def _on_analytics_loaded(self, request_id, result):
+        """Keep and render the result of a finished AnalyticsWorker."""
+        if request_id != self._analytics_request:
+            return  # A newer request superseded this one.
+        self.apply_filters_button.setEnabled(True)
+        self._analytics_worker = None
+        self._last_result = result
+        self.render_analytics(result)
+
+    def render_analytics(self, result):
+        """Render the summary text and chart from an analytics query result."""
+        _ = self.app._
+        try:
+            start_date = result["start_date"]
+            end_date = result["end_date"]
+            monthly_revenue = result["monthly_revenue"]
+            total_expenses = result["total_expenses"]
+            services_summary = result["services_summary"]
+            inventory_list = result["inventory_list"]
+
+            total_revenue = sum(revenue for _month, revenue in monthly_revenue)
             net_profit = total_revenue - total_expenses
 
-            _ = self.app._
-            summary = f"{_('Analytics Report')} ({start_date} to {end_date}):\n\n"
-            summary += f"{_('Total Revenue:')} LE{total_revenue:.2f}\n"
-            summary += f"{_('Total Expenses:')} LE{total_expenses:.2f}\n"
-            summary += f"{_('Net Profit:')} LE{net_profit:.2f}\n\n"
-            summary += f"{_('Services Sold:')}\n"
-            for svc, cnt in services_summary.items():
-                summary += f"  {svc}: {cnt}\n"
-            summary += f"\n{_('Remaining Inventory:')}\n"
-            for name, qty, price in inventory_list:
-                summary += f"  {name}: {qty} {_('units')} @ LE{price:.2f} each\n"
-
-            self.results_display.setPlainText(summary)
-            self.plot_revenue_chart(start_date, end_date, bill_data)
+            parts = [
+                f"{_('Analytics Report')} ({start_date} to {end_date}):",
+                "",
+                f"{_('Total Revenue:')} LE{total_revenue:.2f}",
+                f"{_('Total Expenses:')} LE{total_expenses:.2f}",
+                f"{_('Net Profit:')} LE{net_profit:.2f}",
+                "",
+                f"{_('Services Sold:')}",
+            ]
+            parts.extend(f"  {svc}: {cnt}" for svc, cnt in services_summary.most_common())
+            parts.append("")
+            parts.append(f"{_('Remaining Inventory:')}")
+            units = _('units')
+            parts.extend(f"  {name}: {qty} {units} @ LE{price:.2f} each" for name, qty, price in inventory_list)
+            parts.append("")
+
+            self.results_display.setPlainText("\n".join(parts))
+            self.plot_revenue_chart(start_date, end_date, monthly_revenue)
         except Exception as e:
             logging.exception("Error updating analytics")
-            QtWidgets.QMessageBox.critical(self, self.app._("Error"), str(e))
-
-    def plot_revenue_chart(self, start_date, end_date, bill_data):
+            QtWidgets.QMessageBox.critical(self, _("Error"), str(e))
+
+    def _on_analytics_failed(self, request_id, message):
+        if request_id != self._analytics_request:
+            return
+        self.apply_filters_button.setEnabled(True)
+        self._analytics_worker = None
+        QtWidgets.QMessageBox.critical(self, self.app._("Error"), message)
+
+    def plot_revenue_chart(self, start_date, end_date, monthly_revenue):
+        """Schedule a chart rebuild; repeated calls before it runs only keep the latest data."""
+        self._pending_chart = (start_date, end_date, monthly_revenue)
+        if not self._redraw_pending:
+            self._redraw_pending = True
+            QtCore.QTimer.singleShot(0, self._redraw_chart)
+
+    def _redraw_chart(self):
+        self._redraw_pending = False
+        start_date, end_date, monthly_revenue = self._pending_chart
+        _ = self.app._
         try:
-            # Aggregate revenue by month.
-            revenue_by_month = {}
-            current = start_date.replace(day=1)
-            while current <= end_date:
-                revenue_by_month[current] = 0.0
-                if current.month == 12:
-                    current = current.replace(year=current.year + 1, month=1)
-                else:
-                    current = current.replace(month=current.month + 1)
-            for bill_date, total in bill_data:
-                month_start = bill_date.replace(day=1)
-                if month_start in revenue_by_month:
-                    revenue_by_month[month_start] += total
-            months = sorted(revenue_by_month.keys())
-            revenues = [revenue_by_month[m] for m in months]
-
-            self.figure.clear()
-            ax = self.figure.add_subplot(111)
+            # Lay out every month in the range; the query only returns months with bills.
+            months = np.arange(
+                np.datetime64(start_date, 'M'), np.datetime64(end_date, 'M') + 1
+            ).astype('datetime64[D]')
+            revenues = np.zeros(len(months))
+            if monthly_revenue:
+                bill_months, totals = zip(*monthly_revenue)
+                bill_months = np.array(bill_months, dtype='datetime64[M]').astype('datetime64[D]')
+                revenues[np.searchsorted(months, bill_months)] = totals
+
+            if self._bars is not None:
+                self._bars.remove()
+                self._bars = None
             chart_type = self.chart_type_combo.currentText()
-            if chart_type == self.app._("Bar Chart"):
-                ax.bar(months, revenues, width=20)
+            if chart_type == _("Bar Chart"):
+                self._line.set_visible(False)
+                self._bars = self.ax.bar(months, revenues, width=20, color="C0")
             else:
-                ax.plot(months, revenues, marker="o", linestyle="-")
-            _ = self.app._
-            ax.set_title(_("Monthly Revenue"))
-            ax.set_xlabel(_("Month"))
-            ax.set_ylabel(_("Revenue (LE)"))
-            ax.xaxis.set_major_formatter(mdates.DateFormatter('%Y-%m'))
+                self._line.set_data(months, revenues)
+                self._line.set_visible(True)
+            self.ax.set_title(_("Monthly Revenue"))
+            self.ax.set_xlabel(_("Month"))
+            self.ax.set_ylabel(_("Revenue (LE)"))
+            self.ax.relim(visible_only=True)
+            self.ax.autoscale_view()
             self.figure.autofmt_xdate()
-            self.canvas.draw()
+            # Rasterizing the figure is the expensive part; defer it while the tab is off screen.
+            if self.canvas.isVisible():
+                self.canvas.draw_idle()
+            else:
+                self._chart_stale = True
         except Exception as e:
             logging.exception("Error plotting revenue chart")
-            QtWidgets.QMessageBox.critical(self, self.app._("Error"), str(e))
+            QtWidgets.QMessageBox.critical(self, _("Error"), str(e))
+
+    def showEvent(self, event):
+        """Load the report the first time the tab is shown, or paint a chart rebuilt while hidden."""
+        super().showEvent(event)
+        if not self._analytics_request:
+            self.update_analytics()
+        elif self._chart_stale:
+            self._chart_stale = False
+            self.canvas.draw_idle()
 
     def export_chart(self):
+        _ = self.app._
         try:
-            fname, _ = QtWidgets.QFileDialog.getSaveFileName(
-                self, self.app._("Save Chart"), "", "PNG Files (*.png);;JPEG Files (*.jpg)"
+            fname, _selected_filter = QtWidgets.QFileDialog.getSaveFileName(
+                self, _("Save Chart"), "", "PNG Files (*.png);;JPEG Files (*.jpg)"
             )
             if fname:
                 self.figure.savefig(fname)
                 QtWidgets.QMessageBox.information(
-                    self, self.app._("Export Chart"), self.app._("Chart exported successfully.")
+                    self, _("Export Chart"), _("Chart exported successfully.")
                 )
         except Exception as e:
             logging.exception("Error exporting chart")
-            QtWidgets.QMessageBox.critical(self, self.app._("Error"), str(e))
+            QtWidgets.QMessageBox.critical(self, _("Error"), str(e))
 
     def export_report(self):
+        _ = self.app._
         try:
-            fname, _ = QtWidgets.QFileDialog.getSaveFileName(
-                self, self.app._("Save Report"), "", "Text Files (*.txt)"
+            fname, _selected_filter = QtWidgets.QFileDialog.getSaveFileName(
+                self, _("Save Report"), "", "Text Files (*.txt)"
             )
             if fname:
                 with open(fname, "w", encoding="utf-8") as f:
                     f.write(self.results_display.toPlainText())
                 QtWidgets.QMessageBox.information(
-                    self, self.app._("Export Report"), self.app._("Report exported successfully.")
+                    self, _("Export Report"), _("Report exported successfully.")
                 )
         except Exception as e:
             logging.exception("Error exporting report")
-            QtWidgets.QMessageBox.critical(self, self.app._("Error"), str(e))
+            QtWidgets.QMessageBox.critical(self, _("Error"), str(e))
 
     def add_expense(self):
+        _ = self.app._
         try:
             from main import session_scope, ExpenseRecord
             category = self.expense_category.text().strip()
-            try:
-                amount = float(self.expense_amount.text().strip())
-            except ValueError:
-                raise ValueError(self.app._("Invalid expense amount."))
+            if not self.expense_amount.hasAcceptableInput():
+                raise ValueError(_("Invalid expense amount."))
+            amount = float(self.expense_amount.text())
             description = self.expense_description.text().strip()
             if not category or amount <= 0:
-                raise ValueError(self.app._("Please provide a valid category and positive amount."))
+                raise ValueError(_("Please provide a valid category and positive amount."))
+            if AnalyticsTab._expense_insert is None:
+                # Built once and reused so SQLAlchemy's compiled-statement cache always hits.
+                AnalyticsTab._expense_insert = insert(ExpenseRecord)
             with session_scope() as session:
-                new_expense = ExpenseRecord(
-                    date=date.today(),
-                    category=category,
-                    amount=amount,
-                    description=description
-                )
-                session.add(new_expense)
+                # A Core INSERT skips the identity map and flush machinery for this write-only row.
+                session.execute(AnalyticsTab._expense_insert, {
+                    "date": date.today(),
+                    "category": category,
+                    "amount": amount,
+                    "description": description
+                })
             QtWidgets.QMessageBox.information(
-                self, self.app._("Success"), self.app._("Expense added successfully.")
+                self, _("Success"), _("Expense added successfully.")
             )
             self.expense_category.clear()
             self.expense_amount.clear()
             self.expense_description.clear()
         except Exception as e:
             logging.exception("Error adding expense")
-            QtWidgets.QMessageBox.critical(self, self.app._("Error"), str(e))
+            QtWidgets.QMessageBox.critical(self, _("Error"), str(e))
 
     def refresh_language(self):
+        """Relabel the tab and re-render the last report in the new language, without querying."""
+        _ = self.app._
         try:
-            _ = self.app._
-            self.filter_group.setTitle(_("Filter Options"))
-            self.start_date_label.setText(_("Start Date:"))
-            self.end_date_label.setText(_("End Date:"))
-            self.chart_type_label.setText(_("Chart Type:"))
-            self.chart_type_combo.clear()
-            self.chart_type_combo.addItems([_("Line Chart"), _("Bar Chart")])
-            self.apply_filters_button.setText(_("Apply Filters"))
-
-            self.expense_group.setTitle(_("Expense Entry"))
-            self.expense_category.setPlaceholderText(_("Expense Category (e.g., Rent, Salaries)"))
-            self.expense_amount.setPlaceholderText(_("Amount"))
-            self.expense_description.setPlaceholderText(_("Description (optional)"))
-            self.add_expense_button.setText(_("Add Expense"))
-
-            self.summary_group.setTitle(_("Analytics Summary"))
-            self.chart_group.setTitle(_("Monthly Revenue Chart"))
-            self.export_report_btn.setText(_("Export Report"))
-            self.export_chart_btn.setText(_("Export Chart"))
-            # Refresh analytics data based on current filters.
-            self.update_analytics()
+            self._apply_translations()
+            if self._last_result:
+                self.render_analytics(self._last_result)
         except Exception as e:
             logging.exception("Error refreshing language in AnalyticsTab")
-            QtWidgets.QMessageBox.critical(self, self.app._("Error"), str(e))
+            QtWidgets.QMessageBox.critical(self, _("Error"), str(e))
+
+    def _apply_translations(self):
+        """Set every static label, title and placeholder; no database work."""
+        _ = self.app._
+        self.filter_group.setTitle(_("Filter Options"))
+        self.start_date_label.setText(_("Start Date:"))
+        self.end_date_label.setText(_("End Date:"))
+        self.chart_type_label.setText(_("Chart Type:"))
+        # Relabel in place so the selected chart type survives and no change signal fires.
+        self.chart_type_combo.blockSignals(True)
+        self.chart_type_combo.setItemText(0, _("Line Chart"))
+        self.chart_type_combo.setItemText(1, _("Bar Chart"))
+        self.chart_type_combo.blockSignals(False)
+        self.apply_filters_button.setText(_("Apply Filters"))
+
+        self.expense_group.setTitle(_("Expense Entry"))
+        self.expense_category.setPlaceholderText(_("Expense Category (e.g., Rent, Salaries)"))
+        self.expense_amount.setPlaceholderText(_("Amount"))
+        self.expense_description.setPlaceholderText(_("Description (optional)"))
+        self.add_expense_button.setText(_("Add Expense"))
+
+        self.summary_group.setTitle(_("Analytics Summary"))
+        self.chart_group.setTitle(_("Monthly Revenue Chart"))
+        self.export_report_btn.setText(_("Export Report"))
+        self.export_chart_btn.setText(_("Export Chart"))
@@ -7,18 +7,29 @@ from PyQt5.QtWidgets import (
     QVBoxLayout, QListWidget, QPushButton, QDialog, QLineEdit, QLabel,
     QDateTimeEdit, QFormLayout, QMessageBox, QHBoxLayout, QListWidgetItem
 )
+from sqlalchemy import func
 from styles import BUTTON_STYLE, HEADER_LABEL_STYLE, LISTSTYLE
 
+# Date format for the appointment list entries.
+APPOINTMENT_FORMAT = '%Y-%m-%d %H:%M'
+
 
 class AppointmentsTab(QtWidgets.QWidget):
     """
     A widget to display, add, edit, and delete appointments.
     Appointments are loaded from the database and displayed in a list widget.
+    The list is filled one page at a time; scrolling to the bottom or "Load More" fetches the next page.
     Editing extracts necessary data within an active session to avoid detached instance issues.
     """
+
+    PAGE_SIZE = 200  # Appointments fetched per page.
+    STREAM_CHUNK = 50  # Rows fetched from the cursor at a time within a page.
+
     def __init__(self, app, parent=None):
         super().__init__(parent)
         self.app = app
+        self._loaded_count = 0
+        self._total_count = 0
         self.init_ui()
 
     def init_ui(self):
@@ -30,8 +41,21 @@ class AppointmentsTab(QtWidgets.QWidget):
             self.appointment_list = QListWidget()
             self.appointment_list.setStyleSheet(LISTSTYLE)
             self.appointment_list.itemDoubleClicked.connect(self.show_edit_dialog)
+            self.appointment_list.verticalScrollBar().valueChanged.connect(self._on_list_scrolled)
             main_layout.addWidget(self.appointment_list)
 
+            # Shows how many of the appointments are currently loaded.
+            page_layout = QHBoxLayout()
+            self.page_label = QLabel()
+            self.page_label.setStyleSheet(HEADER_LABEL_STYLE)
+            page_layout.addWidget(self.page_label)
+            page_layout.addStretch()
+            self.load_more_button = QPushButton(self.app._("Load More"))
+            self.load_more_button.setStyleSheet(BUTTON_STYLE)
+            self.load_more_button.clicked.connect(self.load_next_page)
+            page_layout.addWidget(self.load_more_button)
+            main_layout.addLayout(page_layout)
+
             # Button bar with Add, Edit, Delete, and Refresh actions.
             btn_layout = QHBoxLayout()
             self.add_button = QPushButton(self.app._("Add Appointment"))
@@ -63,33 +87,93 @@ class AppointmentsTab(QtWidgets.QWidget):
 
     def load_appointments(self):
         """
-        Load appointments from the database and populate the list widget.
+        Reload appointments from the database, starting again from the first page.
         Each appointment list item stores its database ID (using Qt.UserRole) for future reference.
         """
         try:
-            from main import session_scope, Appointment, _
+            from main import session_scope, Appointment, User
             with session_scope() as session:
-                self.appointment_list.clear()
-                appointments = session.query(Appointment).order_by(Appointment.appointment_datetime).all()
-                for appt in appointments:
-                    # Compose display text.
-                    display = f"{appt.appointment_datetime.strftime('%Y-%m-%d %H:%M')} - {appt.purpose} ({appt.user.phone_number})"
-                    item = QListWidgetItem(display)
-                    # Save the appointment id for editing/deleting.
-                    item.setData(Qt.UserRole, appt.id)
-                    self.appointment_list.addItem(item)
+                # Counted over the same join as load_next_page, so appointments without an owner row,
+                # which are never listed, do not keep "Load More" enabled.
+                self._total_count = (
+                    session.query(func.count(Appointment.id))
+                    .join(User, Appointment.user_id == User.id)
+                    .scalar()
+                ) or 0
+            self.appointment_list.clear()
+            self._loaded_count = 0
+            self.load_next_page()
         except Exception as e:
             logging.exception("Error loading appointments")
             QMessageBox.critical(self, self.app._("Error"), str(e))
 
+    def load_next_page(self):
+        """Append the next PAGE_SIZE appointments to the list widget."""
+        try:
+            from main import session_scope, Appointment, User
+            loaded = 0
+            with session_scope() as session:
+                # Join the owner in the same query so the phone number is not lazy-loaded per row,
+                # and let SQLite format the date so no datetime is built per row.
+                # Rows are streamed in chunks rather than materialized as one list.
+                rows = (
+                    session.query(
+                        Appointment.id,
+                        func.strftime(APPOINTMENT_FORMAT, Appointment.appointment_datetime),
+                        Appointment.purpose,
+                        User.phone_number
+                    )
+                    .join(User, Appointment.user_id == User.id)
+                    .order_by(Appointment.appointment_datetime, Appointment.id)
+                    .limit(self.PAGE_SIZE)
+                    .offset(self._loaded_count)
+                    .execution_options(stream_results=True)
+                    .yield_per(self.STREAM_CHUNK)
+                )
+                # Hold repaints and signals until the whole page is in, so Qt lays out once.
+                self.appointment_list.setUpdatesEnabled(False)
+                self.appointment_list.blockSignals(True)
+                try:
+                    for appt_id, appt_when, purpose, phone_number in rows:
+                        # Compose display text.
+                        display = f"{appt_when} - {purpose} ({phone_number})"
+                        item = QListWidgetItem(display)
+                        # Save the appointment id for editing/deleting.
+                        item.setData(Qt.UserRole, appt_id)
+                        self.appointment_list.addItem(item)
+                        loaded += 1
+                finally:
+                    self.appointment_list.blockSignals(False)
+                    self.appointment_list.setUpdatesEnabled(True)
+            self._loaded_count += loaded
+            self._update_page_label()
+        except Exception as e:
+            logging.exception("Error loading appointments page")
+            QMessageBox.critical(self, self.app._("Error"), str(e))
+
+    def _on_list_scrolled(self, value):
+        """Fetch the next page once the user scrolls to the bottom of the list."""
+        if value >= self.appointment_list.verticalScrollBar().maximum() and self._loaded_count < self._total_count:
+            self.load_next_page()
+
+    def _update_page_label(self):
+        """Show how many appointments are loaded and disable "Load More" once all are."""
+        self.page_label.setText(
+            self.app._("Showing {shown} of {total} appointments").format(
+                shown=self._loaded_count, total=self._total_count
+            )
+        )
+        self.load_more_button.setEnabled(self._loaded_count < self._total_count)
+
     def show_add_dialog(self):
         """
         Display a dialog to add a new appointment.
         Validates that a phone number is provided and the user exists before saving.
         """
+        _ = self.app._
         try:
             dialog = QDialog(self)
-            dialog.setWindowTitle(self.app._("Add New Appointment"))
+            dialog.setWindowTitle(_("Add New Appointment"))
             form = QFormLayout(dialog)
             phone_entry = QLineEdit()
             pet_entry = QLineEdit()
@@ -97,12 +181,12 @@ class AppointmentsTab(QtWidgets.QWidget):
             datetime_entry.setCalendarPopup(True)
             purpose_entry = QLineEdit()
             notes_entry = QLineEdit()
-            form.addRow(self.app._("Phone Number:"), phone_entry)
-            form.addRow(self.app._("Pet (optional):"), pet_entry)
-            form.addRow(self.app._("Appointment Date & Time:"), datetime_entry)
-            form.addRow(self.app._("Purpose:"), purpose_entry)
-            form.addRow(self.app._("Notes:"), notes_entry)
-            btn_save = QPushButton(self.app._("Save"))
+            form.addRow(_("Phone Number:"), phone_entry)
+            form.addRow(_("Pet (optional):"), pet_entry)
+            form.addRow(_("Appointment Date & Time:"), datetime_entry)
+            form.addRow(_("Purpose:"), purpose_entry)
+            form.addRow(_("Notes:"), notes_entry)
+            btn_save = QPushButton(_("Save"))
             btn_save.setStyleSheet(BUTTON_STYLE)
             form.addRow(btn_save)
 
@@ -110,13 +194,13 @@ class AppointmentsTab(QtWidgets.QWidget):
                 try:
                     phone = phone_entry.text().strip()
                     if not phone:
-                        QMessageBox.critical(dialog, self.app._("Error"), self.app._("Phone number is required."))
+                        QMessageBox.critical(dialog, _("Error"), _("Phone number is required."))
                         return
                     from main import session_scope, User, Appointment
                     with session_scope() as session:
                         user = session.query(User).filter_by(phone_number=phone).first()
                         if not user:
-                            QMessageBox.critical(dialog, self.app._("Error"), self.app._("User not found."))
+                            QMessageBox.critical(dialog, _("Error"), _("User not found."))
                             return
                         new_appt = Appointment(
                             user_id=user.id,
@@ -130,13 +214,13 @@ class AppointmentsTab(QtWidgets.QWidget):
                     dialog.accept()
                 except Exception as ex:
                     logging.exception("Error saving new appointment")
-                    QMessageBox.critical(dialog, self.app._("Error"), str(ex))
+                    QMessageBox.critical(dialog, _("Error"), str(ex))
 
             btn_save.clicked.connect(save_appointment)
             dialog.exec_()
         except Exception as e:
             logging.exception("Error in add appointment dialog")
-            QMessageBox.critical(self, self.app._("Error"), str(e))
+            QMessageBox.critical(self, _("Error"), str(e))
 
     def show_edit_dialog(self, item=None):
         """
@@ -144,11 +228,12 @@ class AppointmentsTab(QtWidgets.QWidget):
         If triggered via double-click, an item is passed; otherwise, the currently selected item is used.
         To avoid DetachedInstanceError, extract appointment attributes while the session is active.
         """
+        _ = self.app._
         try:
             if item is None:
                 item = self.appointment_list.currentItem()
             if not item:
-                QMessageBox.warning(self, self.app._("Warning"), self.app._("Please select an appointment to edit."))
+                QMessageBox.warning(self, _("Warning"), _("Please select an appointment to edit."))
                 return
             appt_id = item.data(Qt.UserRole)
             # Load appointment details within a session context.
@@ -156,7 +241,7 @@ class AppointmentsTab(QtWidgets.QWidget):
             with session_scope() as session:
                 appointment = session.get(Appointment, appt_id)
                 if not appointment:
-                    QMessageBox.critical(self, self.app._("Error"), self.app._("Appointment not found."))
+                    QMessageBox.critical(self, _("Error"), _("Appointment not found."))
                     return
                 # Extract necessary attributes and store locally.
                 appt_datetime = appointment.appointment_datetime
@@ -165,7 +250,7 @@ class AppointmentsTab(QtWidgets.QWidget):
                 user_phone = appointment.user.phone_number
             # Create the edit dialog using the stored values.
             dialog = QDialog(self)
-            dialog.setWindowTitle(self.app._("Edit Appointment"))
+            dialog.setWindowTitle(_("Edit Appointment"))
             form = QFormLayout(dialog)
             phone_entry = QLineEdit(user_phone)
             phone_entry.setReadOnly(True)
@@ -174,12 +259,12 @@ class AppointmentsTab(QtWidgets.QWidget):
             datetime_entry.setCalendarPopup(True)
             purpose_entry = QLineEdit(appt_purpose)
             notes_entry = QLineEdit(appt_notes)
-            form.addRow(self.app._("Phone Number:"), phone_entry)
-            form.addRow(self.app._("Pet (optional):"), pet_entry)
-            form.addRow(self.app._("Appointment Date & Time:"), datetime_entry)
-            form.addRow(self.app._("Purpose:"), purpose_entry)
-            form.addRow(self.app._("Notes:"), notes_entry)
-            btn_save = QPushButton(self.app._("Save Changes"))
+            form.addRow(_("Phone Number:"), phone_entry)
+            form.addRow(_("Pet (optional):"), pet_entry)
+            form.addRow(_("Appointment Date & Time:"), datetime_entry)
+            form.addRow(_("Purpose:"), purpose_entry)
+            form.addRow(_("Notes:"), notes_entry)
+            btn_save = QPushButton(_("Save Changes"))
             btn_save.setStyleSheet(BUTTON_STYLE)
             form.addRow(btn_save)
 
@@ -189,7 +274,7 @@ class AppointmentsTab(QtWidgets.QWidget):
                     with session_scope() as session:
                         appt_to_update = session.get(Appointment, appt_id)
                         if not appt_to_update:
-                            QMessageBox.critical(dialog, self.app._("Error"), self.app._("Appointment not found."))
+                            QMessageBox.critical(dialog, _("Error"), _("Appointment not found."))
                             return
                         # Update appointment with new values.
                         appt_to_update.appointment_datetime = datetime_entry.dateTime().toPyDateTime()
@@ -200,27 +285,28 @@ class AppointmentsTab(QtWidgets.QWidget):
                     dialog.accept()
                 except Exception as ex:
                     logging.exception("Error updating appointment")
-                    QMessageBox.critical(dialog, self.app._("Error"), str(ex))
+                    QMessageBox.critical(dialog, _("Error"), str(ex))
 
             btn_save.clicked.connect(save_changes)
             dialog.exec_()
         except Exception as e:
             logging.exception("Error in edit appointment dialog")
-            QMessageBox.critical(self, self.app._("Error"), str(e))
+            QMessageBox.critical(self, _("Error"), str(e))
 
     def delete_appointment(self):
         """
         Delete the currently selected appointment after a confirmation dialog.
         """
+        _ = self.app._
         try:
             item = self.appointment_list.currentItem()
             if not item:
-                QMessageBox.warning(self, self.app._("Warning"), self.app._("Please select an appointment to delete."))
+                QMessageBox.warning(self, _("Warning"), _("Please select an appointment to delete."))
                 return
             appt_id = item.data(Qt.UserRole)
             reply = QMessageBox.question(
-                self, self.app._("Confirm Delete"),
-                self.app._("Are you sure you want to delete this appointment?"),
+                self, _("Confirm Delete"),
+                _("Are you sure you want to delete this appointment?"),
                 QMessageBox.Yes | QMessageBox.No
             )
             if reply == QMessageBox.Yes:
@@ -230,10 +316,10 @@ class AppointmentsTab(QtWidgets.QWidget):
                     if appointment:
                         session.delete(appointment)
                 self.load_appointments()
-                QMessageBox.information(self, self.app._("Success"), self.app._("Appointment deleted."))
+                QMessageBox.information(self, _("Success"), _("Appointment deleted."))
         except Exception as e:
             logging.exception("Error deleting appointment")
-            QMessageBox.critical(self, self.app._("Error"), str(e))
+            QMessageBox.critical(self, _("Error"), str(e))
 
 
     def refresh_language(self):
@@ -243,5 +329,6 @@ class AppointmentsTab(QtWidgets.QWidget):
         self.edit_button.setText(_("Edit Appointment"))
         self.delete_button.setText(_("Delete Appointment"))
         self.refresh_button.setText(_("Refresh"))
+        self.load_more_button.setText(_("Load More"))
         # Update list display header texts if applicable.
         self.load_appointments()
\ No newline at end of file
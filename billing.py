@@ -1,51 +1,190 @@
 import json
 import logging
-from datetime import date, datetime
+from dataclasses import dataclass
+from datetime import date
+from functools import partial
+
+try:
+    # orjson encodes bill details several times faster than the stdlib encoder.
+    from orjson import dumps as _orjson_dumps
+
+    def json_dumps(obj):
+        return _orjson_dumps(obj).decode()
+except ImportError:
+    json_dumps = json.dumps
 
 from PyQt5 import QtWidgets, QtCore
 from PyQt5.QtPrintSupport import QPrinter, QPrintDialog
 from PyQt5.QtWidgets import (
     QWidget, QVBoxLayout, QScrollArea, QGroupBox, QGridLayout, QHBoxLayout,
-    QComboBox, QCheckBox, QLineEdit, QLabel, QPushButton, QTextEdit, QTreeWidget,
-    QTreeWidgetItem, QFileDialog, QMessageBox
+    QComboBox, QCheckBox, QLineEdit, QLabel, QPushButton, QTextEdit, QTreeView,
+    QFileDialog, QMessageBox
 )
+from sqlalchemy import bindparam, select
 from styles import BUTTON_STYLE, GROUPBOX_STYLE, HEADER_LABEL_STYLE
 
+# Services offered on the billing form with their default prices, in display order.
+DEFAULT_SERVICES = (
+    ("Consultation", 50.0),
+    ("Vaccination", 100.0),
+    ("X-Ray", 150.0),
+    ("Blood Test", 80.0),
+    ("Shaving", 30.0),
+    ("Sonar", 40.0),
+    ("Shower", 25.0),
+    ("Nails Cut", 20.0),
+    ("Nails Cut (Aggressive)", 30.0),
+    ("Shaving (Small Areas)", 15.0),
+    ("Sterilization Surgery (Male Cat)", 200.0),
+    ("Sterilization Surgery (Female Cat)", 250.0),
+    ("Sterilization Surgery (Male Dog)", 300.0),
+    ("Sterilization Surgery (Female Dog)", 350.0),
+    ("Canula", 10.0),
+    ("IV", 50.0),
+)
+SERVICE_HEADER_LABELS = ("Service", "Price", "Quantity")
+SERVICE_HEADER_STYLE = "font-weight: bold; " + HEADER_LABEL_STYLE
+
+@dataclass(slots=True)
+class _StockRow:
+    id: int
+    price: float
+    stock: int  # Stock count as loaded; items queued on the current bill are not subtracted.
+
+# Patient and inventory choices shared by billing tabs; cleared whenever those tables change.
+class _BillingCache:
+    patients = None  # (labels, user ids)
+    inventory = None  # {item name: _StockRow}
+
+class InventoryUsedModel(QtCore.QAbstractTableModel):
+    """Item/Qty/Price/Total table over the (name, qty, price) rows used on the current bill."""
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.rows = []
+        self.headers = ["", "", "", ""]
+
+    def rowCount(self, parent=QtCore.QModelIndex()):
+        return 0 if parent.isValid() else len(self.rows)
+
+    def columnCount(self, parent=QtCore.QModelIndex()):
+        return 0 if parent.isValid() else len(self.headers)
+
+    def data(self, index, role=QtCore.Qt.DisplayRole):
+        if role != QtCore.Qt.DisplayRole or not index.isValid():
+            return None
+        name, qty, price = self.rows[index.row()]
+        column = index.column()
+        if column == 0:
+            return name
+        if column == 1:
+            return str(qty)
+        if column == 2:
+            return f"LE{price:.2f}"
+        return f"LE{price * qty:.2f}"
+
+    def headerData(self, section, orientation, role=QtCore.Qt.DisplayRole):
+        if role == QtCore.Qt.DisplayRole and orientation == QtCore.Qt.Horizontal:
+            return self.headers[section]
+        return None
+
+    def set_headers(self, headers):
+        self.headers = list(headers)
+        self.headerDataChanged.emit(QtCore.Qt.Horizontal, 0, len(self.headers) - 1)
+
+    def append_row(self, row):
+        position = len(self.rows)
+        self.beginInsertRows(QtCore.QModelIndex(), position, position)
+        self.rows.append(row)
+        self.endInsertRows()
+
+    def remove_last_rows(self, count):
+        """Remove the count most recently appended rows."""
+        if count <= 0:
+            return
+        first = len(self.rows) - count
+        self.beginRemoveRows(QtCore.QModelIndex(), first, len(self.rows) - 1)
+        del self.rows[first:]
+        self.endRemoveRows()
+
 # Billing service to process and record the billing details.
 class BillService:
+    # Shared statements, built on first use.
+    _bill_insert = None
+    _stock_update = None  # Guarded UPDATE for decrement_stock.
+
     @staticmethod
-    def process_bill(app, patient, services_sold, inventory_items, additional_charges, total):
+    def process_bill(app, patient, services_sold, inventory_items, additional_charges, total, stock_updates=()):
         """
         Processes the bill by adding a BillingRecord to the database.
+        Any (item id, quantity) pairs in stock_updates are taken out of stock in the same transaction.
         Returns an invoice number.
         """
         try:
             from main import session_scope, BillingRecord
             bill_details = {"services": services_sold, "inventory": inventory_items, "additional": additional_charges}
+            bill_date = date.today()
             with session_scope() as session:
-                new_bill = BillingRecord(
-                    date=date.today(),
-                    total=total,
-                    details=json.dumps(bill_details)
-                )
-                session.add(new_bill)
-            invoice_no = f"INV-{datetime.now().strftime('%Y%m%d%H%M%S')}"
+                if stock_updates:
+                    BillService.decrement_stock(session, stock_updates)
+                if BillService._bill_insert is None:
+                    BillService._bill_insert = BillingRecord.__table__.insert()
+                # Table-level INSERT: no ORM object is built, and the new id comes back directly.
+                result = session.execute(BillService._bill_insert, {
+                    "date": bill_date,
+                    "total": total,
+                    "details": json_dumps(bill_details)
+                })
+                bill_id = result.inserted_primary_key[0]
+            BillingTab.invalidate_caches()
+            # Numbered by the record id, so two bills in the same second still get distinct invoices.
+            invoice_no = f"INV-{bill_date:%Y%m%d}-{bill_id:06d}"
             return invoice_no
         except Exception as e:
             logging.exception("Failed to process bill")
             QMessageBox.critical(app, "Error", f"Failed to process bill: {e}")
             return "Error"
 
+    @staticmethod
+    def decrement_stock(session, stock_updates):
+        """
+        Subtracts the billed quantities with one executemany UPDATE by item id.
+        Each row only updates while enough stock is left, so a short or deleted item leaves
+        fewer rows matched; that raises ValueError and rolls back the bill.
+        """
+        from main import InventoryItem
+        if BillService._stock_update is None:
+            inventory = InventoryItem.__table__
+            BillService._stock_update = (
+                inventory.update()
+                .where(inventory.c.id == bindparam("item_id"))
+                .where(inventory.c.stock_count >= bindparam("qty"))
+                .values(stock_count=inventory.c.stock_count - bindparam("qty"))
+            )
+        params = [{"item_id": item_id, "qty": qty} for item_id, qty in stock_updates]
+        result = session.execute(BillService._stock_update, params)
+        if result.rowcount != len(params):
+            raise ValueError("Insufficient stock for one or more inventory items")
+
 class BillingTab(QWidget):
+    # Shared SELECT statements, built on first use.
+    _patients_select = None
+    _inventory_select = None
+
     def __init__(self, app):
         super().__init__()
         self.app = app
         try:
-            from main import _  
-            self._ = _
+            # The app's translator, not main's: the tab may be built after a language change.
+            self._ = self.app._
         except Exception:
             self._ = lambda s: s
-        self.selected_inventory = []
+        # The inventory tree's model owns the (name, qty, price) rows billed so far.
+        self.inv_model = InventoryUsedModel(self)
+        self.selected_inventory = self.inv_model.rows
+        # (item id, quantity) added since the last bill; written to stock when the bill is processed.
+        self._pending_inventory = []
+        self._built = False  # The form is built on first show.
         self.build_ui()
 
     def build_ui(self):
@@ -57,11 +196,17 @@ class BillingTab(QWidget):
             self.inner = QWidget()
             self.inner_layout = QVBoxLayout(self.inner)
             scroll.setWidget(self.inner)
-            self.build_form()
         except Exception as e:
             logging.exception("Error initializing Billing UI")
             QMessageBox.critical(self.app, self._("Error"), str(e))
 
+    def showEvent(self, event):
+        """Build the form, and load its patients and inventory, the first time the tab is shown."""
+        if not self._built:
+            self._built = True
+            self.build_form()
+        super().showEvent(event)
+
     def build_form(self):
         try:
             # Patient Selection Group
@@ -78,46 +223,29 @@ class BillingTab(QWidget):
             self.service_group.setStyleSheet(GROUPBOX_STYLE)
             service_layout = QGridLayout()
             self.service_checkboxes = {}
-            self.service_price_entries = {}
-            self.service_qty_entries = {}
-            header_labels = [self._("Service"), self._("Price"), self._("Quantity")]
-            for col_idx, text in enumerate(header_labels):
-                header_label = QLabel(text)
-                header_label.setStyleSheet("font-weight: bold; " + HEADER_LABEL_STYLE)
+            # (service, checkbox, price edit, quantity edit) per row, walked directly by generate_bill.
+            self._service_rows = []
+            # Indices into _service_rows of the checked services, kept current by the checkboxes.
+            self._checked_services = set()
+            for col_idx, text in enumerate(SERVICE_HEADER_LABELS):
+                header_label = QLabel(self._(text))
+                header_label.setStyleSheet(SERVICE_HEADER_STYLE)
                 service_layout.addWidget(header_label, 0, col_idx)
-            default_services = {
-                "Consultation": 50.0,
-                "Vaccination": 100.0,
-                "X-Ray": 150.0,
-                "Blood Test": 80.0,
-                "Shaving": 30.0,
-                "Sonar": 40.0,
-                "Shower": 25.0,
-                "Nails Cut": 20.0,
-                "Nails Cut (Aggressive)": 30.0,
-                "Shaving (Small Areas)": 15.0,
-                "Sterilization Surgery (Male Cat)": 200.0,
-                "Sterilization Surgery (Female Cat)": 250.0,
-                "Sterilization Surgery (Male Dog)": 300.0,
-                "Sterilization Surgery (Female Dog)": 350.0,
-                "Canula": 10.0,
-                "IV": 50.0
-            }
             row = 1
-            for svc, price in default_services.items():
+            for svc, price in DEFAULT_SERVICES:
                 checkbox = QCheckBox(self._(svc))
                 self.service_checkboxes[svc] = checkbox
                 service_layout.addWidget(checkbox, row, 0)
                 price_edit = QLineEdit()
                 price_edit.setText(str(price))
                 price_edit.setMaximumWidth(80)
-                self.service_price_entries[svc] = price_edit
                 service_layout.addWidget(price_edit, row, 1)
                 qty_edit = QLineEdit()
                 qty_edit.setText("1")
                 qty_edit.setMaximumWidth(50)
-                self.service_qty_entries[svc] = qty_edit
                 service_layout.addWidget(qty_edit, row, 2)
+                checkbox.toggled.connect(partial(self._on_service_toggled, len(self._service_rows)))
+                self._service_rows.append((svc, checkbox, price_edit, qty_edit))
                 row += 1
             service_table_layout = QVBoxLayout()
             service_table_layout.addLayout(service_layout)
@@ -174,8 +302,10 @@ class BillingTab(QWidget):
             self.inv_tree_group = QGroupBox(self._("Inventory Used"))
             self.inv_tree_group.setStyleSheet(GROUPBOX_STYLE)
             inv_tree_layout = QVBoxLayout(self.inv_tree_group)
-            self.inv_tree = QTreeWidget()
-            self.inv_tree.setHeaderLabels([self._("Item"), self._("Qty"), self._("Price"), self._("Total")])
+            self.inv_tree = QTreeView()
+            self.inv_tree.setRootIsDecorated(False)
+            self.inv_model.set_headers([self._("Item"), self._("Qty"), self._("Price"), self._("Total")])
+            self.inv_tree.setModel(self.inv_model)
             inv_tree_layout.addWidget(self.inv_tree)
             self.inner_layout.addWidget(self.inv_tree_group)
 
@@ -216,27 +346,74 @@ class BillingTab(QWidget):
             logging.exception("Error building billing form")
             QMessageBox.critical(self.app, self._("Error"), str(e))
 
+    @classmethod
+    def invalidate_caches(cls):
+        """Forget the cached patient and inventory lists so the next load re-queries them."""
+        _BillingCache.patients = None
+        _BillingCache.inventory = None
+
+    def _on_service_toggled(self, index, checked):
+        if checked:
+            self._checked_services.add(index)
+        else:
+            self._checked_services.discard(index)
+
     def load_patients(self):
+        if not self._built:
+            return  # build_form loads them when the tab is first shown.
         try:
-            from main import session_scope, User
-            with session_scope() as session:
-                patients = session.query(User).all()
-                self.patient_map = {f"{p.user_name} ({p.phone_number})": p.id for p in patients}
+            if _BillingCache.patients is None:
+                from main import session_scope, User
+                if BillingTab._patients_select is None:
+                    # Built once and reused so SQLAlchemy's compiled-statement cache always hits.
+                    BillingTab._patients_select = select(User.user_name, User.phone_number, User.id)
+                with session_scope() as session:
+                    rows = session.execute(BillingTab._patients_select).all()
+                labels = [f"{name} ({phone})" for name, phone, _user_id in rows]
+                _BillingCache.patients = (labels, [user_id for _name, _phone, user_id in rows])
+            # patient_ids[i] is the user id shown at combo index i + 1 (index 0 is Walk-In).
+            labels, self.patient_ids = _BillingCache.patients
+            self.patient_combo.setUpdatesEnabled(False)
+            blocker = QtCore.QSignalBlocker(self.patient_combo)
+            try:
                 self.patient_combo.clear()
                 self.patient_combo.addItem(self._("Walk-In"))
-                self.patient_combo.addItems(list(self.patient_map.keys()))
+                self.patient_combo.addItems(labels)
+            finally:
+                blocker.unblock()
+                self.patient_combo.setUpdatesEnabled(True)
         except Exception as e:
             logging.exception("Error loading patients")
             QMessageBox.critical(self.app, self._("Error"), str(e))
 
-    def load_inventory_items(self):
-        try:
+    @staticmethod
+    def _inventory_stock():
+        """Return the cached {item name: _StockRow} map, querying it if needed."""
+        if _BillingCache.inventory is None:
             from main import session_scope, InventoryItem
+            if BillingTab._inventory_select is None:
+                BillingTab._inventory_select = select(
+                    InventoryItem.item_name, InventoryItem.id,
+                    InventoryItem.selling_price, InventoryItem.stock_count
+                )
             with session_scope() as session:
-                items = session.query(InventoryItem).all()
-                names = [item.item_name for item in items]
-            self.inv_combo.clear()
-            self.inv_combo.addItems(names)
+                rows = session.execute(BillingTab._inventory_select).all()
+            _BillingCache.inventory = {name: _StockRow(item_id, price, stock) for name, item_id, price, stock in rows}
+        return _BillingCache.inventory
+
+    def load_inventory_items(self):
+        if not self._built:
+            return
+        try:
+            names = list(self._inventory_stock())
+            self.inv_combo.setUpdatesEnabled(False)
+            blocker = QtCore.QSignalBlocker(self.inv_combo)
+            try:
+                self.inv_combo.clear()
+                self.inv_combo.addItems(names)
+            finally:
+                blocker.unblock()
+                self.inv_combo.setUpdatesEnabled(True)
         except Exception as e:
             logging.exception("Error loading inventory items")
             QMessageBox.critical(self.app, self._("Error"), str(e))
@@ -250,19 +427,16 @@ class BillingTab(QWidget):
                     raise ValueError(self._("Quantity must be a positive integer."))
             except ValueError:
                 raise ValueError(self._("Invalid quantity"))
-            from main import session_scope, InventoryItem
-            with session_scope() as session:
-                item = session.query(InventoryItem).filter_by(item_name=name).first()
-                if not item:
-                    raise ValueError(self._("Item not found"))
-                if item.stock_count < qty:
-                    raise ValueError(self._("Insufficient stock"))
-                price = item.selling_price
-                total = price * qty
-                tree_item = QTreeWidgetItem([name, str(qty), f"LE{price:.2f}", f"LE{total:.2f}"])
-                self.inv_tree.addTopLevelItem(tree_item)
-                self.selected_inventory.append((name, qty, price))
-                item.stock_count -= qty
+            # Checked against the cached stock less what this bill already queued for the item; the
+            # database is only updated when the bill is processed.
+            row = self._inventory_stock().get(name)
+            if not row:
+                raise ValueError(self._("Item not found"))
+            queued = sum(q for item_id, q in self._pending_inventory if item_id == row.id)
+            if row.stock - queued < qty:
+                raise ValueError(self._("Insufficient stock"))
+            self.inv_model.append_row((name, qty, row.price))
+            self._pending_inventory.append((row.id, qty))
         except Exception as e:
             logging.exception("Error adding inventory item")
             QMessageBox.critical(self.app, self._("Error"), str(e))
@@ -273,22 +447,24 @@ class BillingTab(QWidget):
             total = 0.0
             invoice_lines = []
             services_sold = {}
+            today = date.today().isoformat()
             invoice_lines.append(f"{self._('Patient')}: {patient}")
-            invoice_lines.append(f"{self._('Invoice Date')}: {date.today().strftime('%Y-%m-%d')}")
+            invoice_lines.append(f"{self._('Invoice Date')}: {today}")
             invoice_lines.append(f"\n{self._('Services')}:")
-            for svc, checkbox in self.service_checkboxes.items():
-                if checkbox.isChecked():
-                    try:
-                        price = float(self.service_price_entries[svc].text())
-                        qty = int(self.service_qty_entries[svc].text())
-                        if price < 0 or qty <= 0:
-                            raise ValueError
-                    except ValueError:
-                        raise ValueError(self._(f"Invalid price or quantity for {svc}"))
-                    line_total = price * qty
-                    invoice_lines.append(f" - {svc} x{qty}: LE{line_total:.2f}")
-                    total += line_total
-                    services_sold[svc] = services_sold.get(svc, 0) + qty
+            # Only the checked rows, in form order.
+            for index in sorted(self._checked_services):
+                svc, _checkbox, price_edit, qty_edit = self._service_rows[index]
+                try:
+                    price = float(price_edit.text())
+                    qty = int(qty_edit.text())
+                    if price < 0 or qty <= 0:
+                        raise ValueError
+                except ValueError:
+                    raise ValueError(self._(f"Invalid price or quantity for {svc}"))
+                line_total = price * qty
+                invoice_lines.append(f" - {svc} x{qty}: LE{line_total:.2f}")
+                total += line_total
+                services_sold[svc] = services_sold.get(svc, 0) + qty
             desc = self.other_desc.text().strip()
             price_str = self.other_price.text().strip()
             qty_str = self.other_qty.text().strip()
@@ -327,8 +503,20 @@ class BillingTab(QWidget):
                 invoice_lines.append(f"\n{self._('Tax')} ({tax_percent}%): LE{tax_val:.2f}")
                 total += tax_val
             invoice_lines.append(f"\n{self._('Total Bill')}: LE{total:.2f}")
-            invoice_no = BillService.process_bill(self.app, patient, services_sold, self.selected_inventory, additional, total)
-            header = f"{self._('Invoice Number')}: {invoice_no}\n{self._('Date')}: {date.today().strftime('%Y-%m-%d')}\n\n"
+            invoice_no = BillService.process_bill(
+                self.app, patient, services_sold, self.selected_inventory, additional, total,
+                stock_updates=self._pending_inventory
+            )
+            if invoice_no == "Error":
+                # process_bill reported the failure and nothing was written; drop the queued items
+                # so the next bill is not stuck on them, and reload the stock they were checked against.
+                self.inv_model.remove_last_rows(len(self._pending_inventory))
+                self._pending_inventory = []
+                _BillingCache.inventory = None
+                self.load_inventory_items()
+                return
+            self._pending_inventory = []
+            header = f"{self._('Invoice Number')}: {invoice_no}\n{self._('Date')}: {today}\n\n"
             final_bill = header + "\n".join(invoice_lines)
             self.bill_display.setPlainText(final_bill)
             QMessageBox.information(self.app, self._("Bill Generated"), self._("The bill has been generated."))
@@ -360,14 +548,17 @@ class BillingTab(QWidget):
             QMessageBox.critical(self.app, self._("Error"), str(e))
 
     def refresh_language(self):
+        if not self._built:
+            return  # build_form uses the current language.
         try:
             _ = self.app._
             self.patient_group.setTitle(_( "Select Patient"))
             self.service_group.setTitle(_( "Service Prices"))
-            for svc, checkbox in self.service_checkboxes.items():
+            for svc, checkbox, _price_edit, _qty_edit in self._service_rows:
                 checkbox.setText(_(svc))
             self.inv_sel_group.setTitle(_( "Select Inventory Item"))
             self.inv_tree_group.setTitle(_( "Inventory Used"))
+            self.inv_model.set_headers([_("Item"), _("Qty"), _("Price"), _("Total")])
             self.notes_group.setTitle(_( "Notes"))
             self.bill_group.setTitle(_( "Bill"))
             self.extra_group.setTitle(_( "Additional Charges"))
@@ -13,7 +13,7 @@ from PyQt5.QtWidgets import (
     QFileDialog,
     QGroupBox
 )
-from sqlalchemy import func
+from sqlalchemy import bindparam, func, select
 
 from styles import (
     TITLE_STYLE,
@@ -24,6 +24,49 @@ from styles import (
 )
 
 
+class MetricsSignals(QtCore.QObject):
+    """Signals emitted by MetricsWorker; delivered on the GUI thread."""
+    finished = QtCore.pyqtSignal(dict)
+    failed = QtCore.pyqtSignal(str)
+
+
+class MetricsWorker(QtCore.QRunnable):
+    """Reads the dashboard metrics on a QThreadPool thread."""
+
+    _metrics_select = None  # Shared metrics SELECT, built on first use; "now" is a bound parameter.
+
+    def __init__(self):
+        super().__init__()
+        self.signals = MetricsSignals()
+
+    def run(self):
+        try:
+            from main import session_scope, User, Appointment, InventoryItem, BillingRecord
+            if MetricsWorker._metrics_select is None:
+                # One round-trip: each metric is a scalar subquery of a single SELECT.
+                MetricsWorker._metrics_select = select(
+                    select(func.count(User.id)).scalar_subquery(),
+                    select(func.count(Appointment.id))
+                    .where(Appointment.appointment_datetime >= bindparam('now'))
+                    .scalar_subquery(),
+                    select(func.count(InventoryItem.id)).scalar_subquery(),
+                    select(func.sum(BillingRecord.total)).scalar_subquery(),
+                )
+            with session_scope() as session:
+                patients, appointments, inventory, revenue = session.execute(
+                    MetricsWorker._metrics_select, {'now': datetime.now()}
+                ).one()
+            self.signals.finished.emit({
+                'patients': patients or 0,
+                'appointments': appointments or 0,
+                'inventory': inventory or 0,
+                'revenue': revenue or 0.0
+            })
+        except Exception as e:
+            logging.exception("Error querying Dashboard metrics")
+            self.signals.failed.emit(str(e))
+
+
 class DashboardTab(QtWidgets.QWidget):
     """
     Dashboard tab for Vet Clinic application showing key metrics and navigation.
@@ -42,14 +85,16 @@ class DashboardTab(QtWidgets.QWidget):
             'inventory': 0,
             'revenue': 0.0
         }
+        self._pool = QtCore.QThreadPool.globalInstance()
+        self._worker = None
+        self._refresh_in_flight = False
+        self._translate_prefixes()
 
         self._init_ui()
-        self.update_metrics()
 
-        # Schedule auto-refresh
+        # Schedule auto-refresh; the timer only runs while the dashboard is shown.
         self._timer = QtCore.QTimer(self)
-        self._timer.timeout.connect(self.update_metrics)
-        self._timer.start(self.REFRESH_INTERVAL_MS)
+        self._timer.timeout.connect(self._on_refresh_timer)
 
     def _init_ui(self):
         """Initializes UI components and layout."""
@@ -146,41 +191,56 @@ class DashboardTab(QtWidgets.QWidget):
             QMessageBox.critical(self, self.tr("Error"), str(e))
 
     def update_metrics(self):
-        """Fetches latest metrics from database and updates UI labels."""
+        """Fetches latest metrics on the thread pool; the labels update when the worker reports back."""
+        if self._refresh_in_flight:
+            return  # A refresh is already running; its result is recent enough.
         try:
-            from main import session_scope, User, Appointment, InventoryItem, BillingRecord
-            with session_scope() as session:
-                self._metrics['patients'] = session.query(func.count(User.id)).scalar() or 0
-
-                now = datetime.now()
-                self._metrics['appointments'] = (
-                    session.query(func.count(Appointment.id))
-                    .filter(Appointment.appointment_datetime >= now)
-                    .scalar() or 0
-                )
-
-                self._metrics['inventory'] = session.query(func.count(InventoryItem.id)).scalar() or 0
-                self._metrics['revenue'] = session.query(func.sum(BillingRecord.total)).scalar() or 0.0
-
-            self._refresh_labels()
+            worker = MetricsWorker()
+            worker.signals.finished.connect(self._apply_metrics)
+            worker.signals.failed.connect(self._on_metrics_failed)
+            self._worker = worker
+            self._refresh_in_flight = True
+            self._pool.start(worker)
         except Exception as e:
+            self._refresh_in_flight = False
             logging.exception("Error updating Dashboard metrics")
             QMessageBox.critical(self, self.tr("Error updating metrics"), str(e))
 
+    def _apply_metrics(self, metrics):
+        """Stores metrics delivered by MetricsWorker and refreshes the labels."""
+        self._refresh_in_flight = False
+        self._worker = None
+        self._metrics.update(metrics)
+        self._refresh_labels()
+
+    def _on_metrics_failed(self, message):
+        self._refresh_in_flight = False
+        self._worker = None
+        QMessageBox.critical(self, self.tr("Error updating metrics"), message)
+
     def _refresh_labels(self):
-        """Localizes and refreshes metric label texts."""
-        self._labels['patients'].setText(
-            f"{self.tr('Total Patients:')} {self._metrics['patients']}"
-        )
-        self._labels['appointments'].setText(
-            f"{self.tr('Active Appointments:')} {self._metrics['appointments']}"
-        )
-        self._labels['inventory'].setText(
-            f"{self.tr('Inventory Items:')} {self._metrics['inventory']}"
-        )
-        self._labels['revenue'].setText(
-            f"{self.tr('Total Revenue:')} {self._metrics['revenue']:.2f} {self.tr('LE')}"
-        )
+        """Localizes and refreshes metric label texts, skipping labels whose values are unchanged."""
+        for key, value in self._metrics.items():
+            if self._last_rendered.get(key) == value:
+                continue
+            if key == 'revenue':
+                text = f"{self._label_prefixes[key]} {value:.2f} {self._currency_suffix}"
+            else:
+                text = f"{self._label_prefixes[key]} {value}"
+            self._labels[key].setText(text)
+            self._last_rendered[key] = value
+
+    def _translate_prefixes(self):
+        """Caches the translated metric captions; called again when the language changes."""
+        self._label_prefixes = {
+            'patients': self.tr('Total Patients:'),
+            'appointments': self.tr('Active Appointments:'),
+            'inventory': self.tr('Inventory Items:'),
+            'revenue': self.tr('Total Revenue:')
+        }
+        self._currency_suffix = self.tr('LE')
+        # Captions changed, so every label must be rewritten on the next refresh.
+        self._last_rendered = {}
 
     def export_dashboard(self):
         """Exports the dashboard view to an image file."""
@@ -220,9 +280,25 @@ class DashboardTab(QtWidgets.QWidget):
         self._export_btn.setToolTip(self.tr("Export a screenshot of the dashboard"))
 
         # Update metric labels and placeholder
+        self._translate_prefixes()
         self._refresh_labels()
         self._chart_placeholder.setText(self.tr("Chart/Graph will be displayed here."))
 
+    def showEvent(self, event):
+        """Refresh the metrics whenever the dashboard comes into view and resume auto-refresh."""
+        super().showEvent(event)
+        self._timer.start(self.REFRESH_INTERVAL_MS)
+        self.update_metrics()
+
+    def hideEvent(self, event):
+        """Pause auto-refresh while another tab is shown or the window is minimized."""
+        self._timer.stop()
+        super().hideEvent(event)
+
+    def _on_refresh_timer(self):
+        if self.isVisible() and not self.window().isMinimized():
+            self.update_metrics()
+
     def changeEvent(self, event):
         """Handle dynamic language change events."""
         if event.type() == QEvent.LanguageChange:
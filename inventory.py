@@ -1,30 +1,200 @@
 # inventory.py
 
+import csv
 import logging
 from datetime import date, timedelta
 
+import numpy as np
 from PyQt5 import QtWidgets, QtCore
-from PyQt5.QtCore import QDate
+from PyQt5.QtCore import QDate, Qt
 from PyQt5.QtGui import QColor, QBrush
 from PyQt5.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QGroupBox, QLineEdit, QLabel,
-    QPushButton, QComboBox, QTableWidget, QTableWidgetItem, QMessageBox, QDateEdit, QCheckBox
+    QPushButton, QComboBox, QTableView, QMessageBox, QDateEdit, QCheckBox, QFileDialog
 )
+from sqlalchemy import select
 
 from styles import BUTTON_STYLE, GROUPBOX_STYLE, HEADER_LABEL_STYLE, LISTSTYLE
 
+FIELD_LABEL_KEYS = ("Item Name", "Stock Count", "Purchase Price",
+                    "Selling Price", "Purchase Date", "Expiry Date")
+HEADER_KEYS = ("Item Name", "Stock Count", "Purchase Price",
+               "Selling Price", "Profit", "Purchase Date", "Expiry Date")
+# Column layout of the bulk import/export CSV files.
+CSV_FIELDS = ("item_name", "stock_count", "purchase_price",
+              "selling_price", "purchase_date", "expiry_date")
+# Shared cell backgrounds, so painting highlighted rows allocates nothing.
+LOW_STOCK_BRUSH = QBrush(QColor("yellow"))
+EXPIRES_TODAY_BRUSH = QBrush(QColor("red"))
+
+
+class InventoryModel(QtCore.QAbstractTableModel):
+    """
+    Table model over inventory rows of
+    (id, item_name, stock_count, purchase_price, selling_price, purchase_date, expiry_date).
+    Display strings are formatted once per row when rows are loaded; highlighting is
+    decided on demand, so no per-cell item objects are kept.
+    """
+    LOW_STOCK_THRESHOLD = 5
+
+    def __init__(self, headers, parent=None):
+        super().__init__(parent)
+        self.headers = list(headers)
+        self.rows = []
+        self.profits = []
+        self.display = []
+        # Day the rows were loaded; cells expiring on it are highlighted.
+        self.today = date.today()
+
+    def rowCount(self, parent=QtCore.QModelIndex()):
+        return 0 if parent.isValid() else len(self.rows)
+
+    def columnCount(self, parent=QtCore.QModelIndex()):
+        return 0 if parent.isValid() else len(self.headers)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        position = index.row()
+        column = index.column()
+        if role == Qt.DisplayRole:
+            return self.display[position][column]
+        item_id, name, stock_count, purchase, selling, purchase_date, expiry = self.rows[position]
+        if role == Qt.UserRole:
+            if column == 2:
+                return max(stock_count, 0)
+            if column == 5:
+                return self.profits[position]
+            if column in (6, 7):
+                return self.display[position][column]
+            return self.rows[position][column]
+        if role == Qt.BackgroundRole:
+            if column == 2 and stock_count < self.LOW_STOCK_THRESHOLD:
+                return LOW_STOCK_BRUSH
+            if expiry is not None and expiry == self.today:
+                return EXPIRES_TODAY_BRUSH
+        return None
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return self.headers[section]
+        return None
+
+    def set_headers(self, headers):
+        self.headers = list(headers)
+        self.headerDataChanged.emit(Qt.Horizontal, 0, len(self.headers) - 1)
+
+    @staticmethod
+    def _compute_profits(rows):
+        """(selling - purchase) * max(stock, 0) for every row in one vectorized pass."""
+        count = len(rows)
+        stock = np.fromiter((row[2] for row in rows), dtype=np.int64, count=count)
+        purchase = np.fromiter((row[3] for row in rows), dtype=np.float64, count=count)
+        selling = np.fromiter((row[4] for row in rows), dtype=np.float64, count=count)
+        return ((selling - purchase) * np.maximum(stock, 0)).tolist()
+
+    @staticmethod
+    def _format_row(row, profit):
+        item_id, name, stock_count, purchase, selling, purchase_date, expiry = row
+        # Show expiry date only if it is not None.
+        return (str(item_id), name, str(max(stock_count, 0)), str(purchase), str(selling),
+                str(profit), purchase_date.isoformat(), expiry.isoformat() if expiry else "")
+
+    def set_rows(self, rows):
+        self.beginResetModel()
+        self.today = date.today()
+        self.rows = list(rows)
+        self.profits = self._compute_profits(self.rows)
+        self.display = list(map(self._format_row, self.rows, self.profits))
+        self.endResetModel()
+
+    def _position(self, item_id):
+        for position, row in enumerate(self.rows):
+            if row[0] == item_id:
+                return position
+        return -1
+
+    def append_row(self, row):
+        position = len(self.rows)
+        self.beginInsertRows(QtCore.QModelIndex(), position, position)
+        self.rows.append(row)
+        profit = self._compute_profits([row])[0]
+        self.profits.append(profit)
+        self.display.append(self._format_row(row, profit))
+        self.endInsertRows()
+
+    def replace_row(self, row):
+        """Swap in the new values for the row with the same id and repaint only that row."""
+        position = self._position(row[0])
+        if position >= 0:
+            self.rows[position] = row
+            self.profits[position] = self._compute_profits([row])[0]
+            self.display[position] = self._format_row(row, self.profits[position])
+            self.dataChanged.emit(self.index(position, 0), self.index(position, len(self.headers) - 1))
+
+    def remove_row(self, item_id):
+        position = self._position(item_id)
+        if position >= 0:
+            self.beginRemoveRows(QtCore.QModelIndex(), position, position)
+            del self.rows[position]
+            del self.profits[position]
+            del self.display[position]
+            self.endRemoveRows()
+
+
+class InventoryLoadSignals(QtCore.QObject):
+    """Signals emitted by InventoryLoadWorker; delivered on the GUI thread."""
+    finished = QtCore.pyqtSignal(list)
+    failed = QtCore.pyqtSignal(str)
+
+
+class InventoryLoadWorker(QtCore.QRunnable):
+    """Reads the inventory rows on a QThreadPool thread for the tab's first load."""
+
+    def __init__(self):
+        super().__init__()
+        self.signals = InventoryLoadSignals()
+
+    def run(self):
+        try:
+            from main import session_scope, InventoryItem
+            with session_scope() as session:
+                rows = [tuple(row) for row in session.execute(InventoryManagementTab._select_rows(InventoryItem))]
+            self.signals.finished.emit(rows)
+        except Exception as e:
+            logging.exception("Error loading inventory")
+            self.signals.failed.emit(str(e))
+
 
 class InventoryManagementTab(QWidget):
+    SEARCH_DEBOUNCE_MS = 120
+    EXPORT_CHUNK = 1000  # Rows fetched from the cursor at a time while exporting.
+    _rows_select = None
+
     def __init__(self, app):
         super().__init__()
         self.app = app
-        from main import session_scope, InventoryItem, _, CURRENT_LANG
+        from main import session_scope, bulk_insert, InventoryItem
         self.session_scope = session_scope
+        self.bulk_insert = bulk_insert
         self.InventoryItem = InventoryItem
-        self._ = _
-        self.rtl = (CURRENT_LANG == "ar")
+        # The app's translator and language, not main's: the tab may be built after a language change.
+        self._ = app._
+        self.rtl = (app.CURRENT_LANG == "ar")
+        self._lang = app.CURRENT_LANG  # Language the labels were last translated into.
+        # Write-through copy of the inventory rows, keyed by id; single-item edits update it in place.
+        self._rows_cache = {}
+        # Names currently listed in the item name dropdown.
+        self._dropdown_names = set()
+        self._translate_labels()
         self.init_ui()
 
+    def _translate_labels(self):
+        """Translate the form labels and table headers once per language."""
+        _ = self.app._
+        self._field_labels = tuple(_(key) for key in FIELD_LABEL_KEYS)
+        self._headers = ("id",) + tuple(_(key) for key in HEADER_KEYS)
+
     def init_ui(self):
         self.main_layout = QVBoxLayout(self)
         
@@ -36,6 +206,12 @@ class InventoryManagementTab(QWidget):
         self.btn_search = QPushButton(self._("Search"))
         self.btn_search.setStyleSheet(BUTTON_STYLE)
         self.btn_search.clicked.connect(self.search_inventory)
+        # Filter live while typing, once the keystrokes pause.
+        self._search_timer = QtCore.QTimer(self)
+        self._search_timer.setSingleShot(True)
+        self._search_timer.setInterval(self.SEARCH_DEBOUNCE_MS)
+        self._search_timer.timeout.connect(self.search_inventory)
+        self.search_entry.textChanged.connect(self._search_timer.start)
         search_layout.addWidget(self.search_entry)
         search_layout.addWidget(self.btn_search)
         self.main_layout.addLayout(search_layout)
@@ -49,6 +225,12 @@ class InventoryManagementTab(QWidget):
         # Item Name: using QComboBox with editable entries.
         self.inv_item_name = QComboBox()
         self.inv_item_name.setEditable(True)
+        # Complete typed names against a sorted list so Qt can binary-search it.
+        self._completer_model = QtCore.QStringListModel(self)
+        completer = QtWidgets.QCompleter(self._completer_model, self)
+        completer.setCaseSensitivity(Qt.CaseInsensitive)
+        completer.setModelSorting(QtWidgets.QCompleter.CaseInsensitivelySortedModel)
+        self.inv_item_name.setCompleter(completer)
         # Stock count and prices.
         self.inv_stock = QLineEdit()
         self.inv_purchase = QLineEdit()
@@ -66,18 +248,16 @@ class InventoryManagementTab(QWidget):
         self.chk_no_expiry = QCheckBox(self._("No Expiry Date"))
         self.chk_no_expiry.stateChanged.connect(self.toggle_expiry)
 
-        fields = [
-            (self._("Item Name"), self.inv_item_name),
-            (self._("Stock Count"), self.inv_stock),
-            (self._("Purchase Price"), self.inv_purchase),
-            (self._("Selling Price"), self.inv_selling),
-            (self._("Purchase Date"), self.inv_purchase_date),
-            (self._("Expiry Date"), self.inv_expiry),
-        ]
+        fields = zip(self._field_labels, (
+            self.inv_item_name, self.inv_stock, self.inv_purchase,
+            self.inv_selling, self.inv_purchase_date, self.inv_expiry,
+        ))
+        self._form_labels = []
         for idx, (label_txt, widget) in enumerate(fields):
             row, col = divmod(idx, 2)
             label = QLabel(label_txt)
             label.setStyleSheet(HEADER_LABEL_STYLE)
+            self._form_labels.append(label)
             self.form_layout.addWidget(label, row, col * 2)
             self.form_layout.addWidget(widget, row, col * 2 + 1)
         # Add the "No Expiry Date" checkbox after expiry field.
@@ -115,18 +295,46 @@ class InventoryManagementTab(QWidget):
         btn_ops_layout.addWidget(self.btn_email_reminders)
         self.main_layout.addLayout(btn_ops_layout)
         
-        # Inventory Table.
-        self.table = QTableWidget()
+        # Inventory Table: a view over InventoryModel, sorted through a proxy on the raw values.
+        self.model = InventoryModel(self._headers, self)
+        self.proxy = QtCore.QSortFilterProxyModel(self)
+        self.proxy.setSourceModel(self.model)
+        self.proxy.setSortRole(Qt.UserRole)
+        # Searching filters the proxy on the item name column; the model keeps every row.
+        self.proxy.setFilterKeyColumn(1)
+        self.proxy.setFilterCaseSensitivity(Qt.CaseInsensitive)
+        self.table = QTableView()
         self.table.setStyleSheet(LISTSTYLE)
-        self.table.setColumnCount(8)
-        self.table.setHorizontalHeaderLabels([
-            "id", self._("Item Name"), self._("Stock Count"), self._("Purchase Price"),
-            self._("Selling Price"), self._("Profit"), self._("Purchase Date"), self._("Expiry Date")
-        ])
+        self.table.setModel(self.proxy)
+        self.table.setSelectionBehavior(QTableView.SelectRows)
         self.table.hideColumn(0)
         self.table.setSortingEnabled(True)
         self.main_layout.addWidget(self.table)
 
+        self._load_worker = None
+        self.start_initial_load()
+
+    def start_initial_load(self):
+        """Fill the table and dropdown from a pool thread so the tab opens without waiting on the query."""
+        worker = InventoryLoadWorker()
+        worker.signals.finished.connect(self._apply_loaded_rows)
+        worker.signals.failed.connect(self._on_load_failed)
+        self._load_worker = worker
+        QtCore.QThreadPool.globalInstance().start(worker)
+
+    def _apply_loaded_rows(self, rows):
+        if self._load_worker is None:
+            return  # A synchronous refresh already loaded newer rows.
+        self._load_worker = None
+        self._load_rows(rows)
+        self._set_dropdown_names([row[1] for row in rows])
+
+    def _on_load_failed(self, message):
+        self._load_worker = None
+        QMessageBox.critical(self.app, self._("Error"), message)
+
+    def refresh_all(self):
+        """Reload the table and the item name dropdown from the database."""
         self.refresh_inventory_tree()
         self.update_inventory_dropdown()
 
@@ -138,27 +346,21 @@ class InventoryManagementTab(QWidget):
             self.inv_expiry.setEnabled(True)
 
     def refresh_language(self):
+        if self.app.CURRENT_LANG == self._lang:
+            return  # Settings were applied without changing the language.
+        self._lang = self.app.CURRENT_LANG
         _ = self.app._
+        self._translate_labels()
         self.add_group.setTitle(_( "Add Inventory Item"))
-        field_labels = [_( "Item Name"), _( "Stock Count"), _( "Purchase Price"),
-                         _( "Selling Price"), _( "Purchase Date"), _( "Expiry Date")]
-        for idx in range(self.form_layout.count()):
-            item = self.form_layout.itemAt(idx)
-            widget = item.widget()
-            if isinstance(widget, QLabel):
-                index = idx // 2
-                if index < len(field_labels):
-                    widget.setText(field_labels[index])
+        for label, text in zip(self._form_labels, self._field_labels):
+            label.setText(text)
         self.btn_save.setText(_( "Save"))
         self.btn_bulk_import.setText(_( "Bulk Import"))
         self.btn_bulk_export.setText(_( "Bulk Export"))
         self.btn_email_reminders.setText(_( "Email Reminders"))
         self.btn_delete_item.setText(_( "Delete Item"))
         self.btn_modify_item.setText(_( "Modify Item"))
-        headers = ["id", _( "Item Name"), _( "Stock Count"), _( "Purchase Price"),
-                   _( "Selling Price"), _( "Profit"), _( "Purchase Date"), _( "Expiry Date")]
-        self.table.setHorizontalHeaderLabels(headers)
-        self.update_inventory_dropdown()
+        self.model.set_headers(self._headers)
 
     def add_inventory_item(self):
         try:
@@ -182,8 +384,7 @@ class InventoryManagementTab(QWidget):
                 expiry_val = self.inv_expiry.date().toPyDate()
                 if expiry_val < date.today():
                     raise ValueError(self._("Expiry date cannot be in the past."))
-            from main import session_scope, InventoryItem
-            with session_scope() as session:
+            with self.session_scope() as session:
                 new_item = self.InventoryItem(
                     item_name=item_name_val,
                     stock_count=stock_val,
@@ -193,15 +394,20 @@ class InventoryManagementTab(QWidget):
                     expiry_date=expiry_val
                 )
                 session.add(new_item)
+                session.flush()
+                row = (new_item.id, item_name_val, stock_val, purchase_val,
+                       selling_val, purchase_date_val, expiry_val)
+            self._rows_cache[row[0]] = row
+            self.model.append_row(row)
+            self._add_dropdown_name(item_name_val)
             QMessageBox.information(
                 self.app,
                 self._("Success"),
                 self._("Item '{item}' added successfully.").format(item=item_name_val)
             )
             self.clear_form()
-            self.refresh_inventory_tree()
-            self.update_inventory_dropdown()
             if hasattr(self.app, 'billing_tab'):
+                self.app.billing_tab.invalidate_caches()
                 self.app.billing_tab.load_inventory_items()
         except ValueError as e:
             QMessageBox.critical(self.app, self._("Error"), str(e))
@@ -219,91 +425,81 @@ class InventoryManagementTab(QWidget):
         self.chk_no_expiry.setChecked(False)
 
     def refresh_inventory_tree(self):
-        self.table.setRowCount(0)
-        low_stock_threshold = 5
-        from main import session_scope
         with self.session_scope() as session:
-            items = session.query(self.InventoryItem).all()
-            for it in items:
-                stock = max(it.stock_count, 0)
-                profit = (it.selling_price - it.purchase_price) * stock
-                row = self.table.rowCount()
-                self.table.insertRow(row)
-                self.table.setItem(row, 0, QTableWidgetItem(str(it.id)))
-                self.table.setItem(row, 1, QTableWidgetItem(it.item_name))
-                self.table.setItem(row, 2, QTableWidgetItem(str(stock)))
-                self.table.setItem(row, 3, QTableWidgetItem(str(it.purchase_price)))
-                self.table.setItem(row, 4, QTableWidgetItem(str(it.selling_price)))
-                self.table.setItem(row, 5, QTableWidgetItem(str(profit)))
-                self.table.setItem(row, 6, QTableWidgetItem(it.purchase_date.strftime("%Y-%m-%d")))
-                # Show expiry date only if it is not None.
-                expiry_text = it.expiry_date.strftime("%Y-%m-%d") if it.expiry_date else ""
-                self.table.setItem(row, 7, QTableWidgetItem(expiry_text))
-                if it.expiry_date and it.expiry_date == date.today():
-                    for col in range(self.table.columnCount()):
-                        cell = self.table.item(row, col)
-                        if cell:
-                            cell.setBackground(QBrush(QColor("red")))
-                if it.stock_count < low_stock_threshold:
-                    stock_cell = self.table.item(row, 2)
-                    if stock_cell:
-                        stock_cell.setBackground(QBrush(QColor("yellow")))
+            rows = [tuple(row) for row in session.execute(self._select_rows(self.InventoryItem))]
+        self._load_rows(rows)
+        if self._load_worker is not None:
+            # Supersedes the pending first load, which would also have filled the dropdown.
+            self._load_worker = None
+            self._set_dropdown_names([row[1] for row in rows])
+
+    def _load_rows(self, rows):
+        self._rows_cache = {row[0]: row for row in rows}
+        self.model.set_rows(rows)
 
     def update_inventory_dropdown(self):
-        from main import session_scope
         with self.session_scope() as session:
-            items = session.query(self.InventoryItem).all()
-            names = [item.item_name for item in items]
-        self.inv_item_name.clear()
-        self.inv_item_name.addItems(names)
+            names = session.execute(select(self.InventoryItem.item_name)).scalars().all()
+        self._set_dropdown_names(names)
+
+    def _set_dropdown_names(self, names):
+        """Add and remove only the names that differ from what the dropdown already lists."""
+        current = set(names)
+        if current == self._dropdown_names:
+            return
+        for name in self._dropdown_names - current:
+            self.inv_item_name.removeItem(self.inv_item_name.findText(name))
+        for name in dict.fromkeys(names):
+            if name not in self._dropdown_names:
+                self.inv_item_name.addItem(name)
+        self._dropdown_names = current
+        self._sync_completer()
+
+    def _sync_completer(self):
+        self._completer_model.setStringList(sorted(self._dropdown_names, key=str.lower))
+
+    def _add_dropdown_name(self, name):
+        if name not in self._dropdown_names:
+            self._dropdown_names.add(name)
+            self.inv_item_name.addItem(name)
+            self._sync_completer()
+
+    def _drop_dropdown_name(self, name):
+        """Remove a name from the dropdown once no cached item uses it."""
+        if name not in self._dropdown_names or any(row[1] == name for row in self._rows_cache.values()):
+            return
+        self._dropdown_names.discard(name)
+        self.inv_item_name.removeItem(self.inv_item_name.findText(name))
+        self._sync_completer()
+
+    @classmethod
+    def _select_rows(cls, InventoryItem):
+        """Column-only SELECT in InventoryModel row order, built once."""
+        if cls._rows_select is None:
+            cls._rows_select = select(
+                InventoryItem.id, InventoryItem.item_name, InventoryItem.stock_count,
+                InventoryItem.purchase_price, InventoryItem.selling_price,
+                InventoryItem.purchase_date, InventoryItem.expiry_date
+            )
+        return cls._rows_select
 
     def search_inventory(self):
-        filter_text = self.search_entry.text().strip().lower()
-        # Collect needed item data while the session is active.
-        item_data = []
-        from main import session_scope
-        with self.session_scope() as session:
-            items = session.query(self.InventoryItem).all()
-            for it in items:
-                # Extract required attributes now and store in a dictionary.
-                item_data.append({
-                    "id": it.id,
-                    "item_name": it.item_name,
-                    "stock_count": it.stock_count,
-                    "purchase_price": it.purchase_price,
-                    "selling_price": it.selling_price,
-                    "purchase_date": it.purchase_date,
-                    "expiry_date": it.expiry_date
-                })
-        
-        self.table.setRowCount(0)
-        for data in item_data:
-            # Now you can safely access data["item_name"] without triggering DB access.
-            if filter_text in data["item_name"].lower():
-                stock = max(data["stock_count"], 0)
-                profit = (data["selling_price"] - data["purchase_price"]) * stock
-                row = self.table.rowCount()
-                self.table.insertRow(row)
-                self.table.setItem(row, 0, QtWidgets.QTableWidgetItem(str(data["id"])))
-                self.table.setItem(row, 1, QtWidgets.QTableWidgetItem(data["item_name"]))
-                self.table.setItem(row, 2, QtWidgets.QTableWidgetItem(str(stock)))
-                self.table.setItem(row, 3, QtWidgets.QTableWidgetItem(str(data["purchase_price"])))
-                self.table.setItem(row, 4, QtWidgets.QTableWidgetItem(str(data["selling_price"])))
-                self.table.setItem(row, 5, QtWidgets.QTableWidgetItem(str(profit)))
-                self.table.setItem(row, 6, QtWidgets.QTableWidgetItem(data["purchase_date"].strftime("%Y-%m-%d")))
-                expiry_text = data["expiry_date"].strftime("%Y-%m-%d") if data["expiry_date"] else ""
-                self.table.setItem(row, 7, QtWidgets.QTableWidgetItem(expiry_text))
-    
+        """Show only items whose name contains the search text; no query or model reset is needed."""
+        self.proxy.setFilterFixedString(self.search_entry.text().strip())
+
+    def _cached_rows(self):
+        """Rows of the row cache, loading it first if the initial load has not reported back yet."""
+        if self._load_worker is not None:
+            self.refresh_inventory_tree()
+        return self._rows_cache.values()
 
     def expiry_reminder(self):
         threshold = date.today() + timedelta(days=30)
-        from main import session_scope
-        with self.session_scope() as session:
-            expiring = session.query(self.InventoryItem).filter(
-                self.InventoryItem.expiry_date != None,
-                self.InventoryItem.expiry_date <= threshold
-            ).all()
-            expiring_data = [(item.item_name, item.expiry_date.strftime('%Y-%m-%d')) for item in expiring]
+        # The row cache already holds every item, so filter it rather than query again.
+        expiring_data = [
+            (row[1], row[6].isoformat()) for row in self._cached_rows()
+            if row[6] is not None and row[6] <= threshold
+        ]
         if not expiring_data:
             QMessageBox.information(self.app, self._("Expiry Reminder"),
                                     self._("No items expiring within the next month."))
@@ -312,13 +508,8 @@ class InventoryManagementTab(QWidget):
             QMessageBox.information(self.app, self._("Expiry Reminder"), text)
 
     def low_stock_reminder(self):
-        threshold = 5
-        from main import session_scope
-        with self.session_scope() as session:
-            low_stock = session.query(self.InventoryItem).filter(
-                self.InventoryItem.stock_count < threshold
-            ).all()
-            low_stock_data = [(item.item_name, item.stock_count) for item in low_stock]
+        threshold = InventoryModel.LOW_STOCK_THRESHOLD
+        low_stock_data = [(row[1], row[2]) for row in self._cached_rows() if row[2] < threshold]
         if not low_stock_data:
             QMessageBox.information(self.app, self._("Low Stock Reminder"),
                                     self._("No items with low stock."))
@@ -326,34 +517,40 @@ class InventoryManagementTab(QWidget):
             text = "\n".join(f"{name} (Stock: {stock})" for name, stock in low_stock_data)
             QMessageBox.information(self.app, self._("Low Stock Reminder"), text)
 
+    def selected_item_id(self):
+        """Return the id of the inventory row selected in the table, or None."""
+        index = self.table.currentIndex()
+        if not index.isValid():
+            return None
+        return self.model.rows[self.proxy.mapToSource(index).row()][0]
+
     def delete_item(self):
-        selected = self.table.currentRow()
-        if selected < 0:
+        item_id = self.selected_item_id()
+        if item_id is None:
             QMessageBox.warning(self.app, self._("Warning"), self._("Please select an item to delete."))
             return
-        item_id = self.table.item(selected, 0).text()
         reply = QMessageBox.question(self.app, self._("Confirm"),
                                      self._("Are you sure you want to delete the selected item?"),
                                      QMessageBox.Yes | QMessageBox.No)
         if reply == QMessageBox.Yes:
-            from main import session_scope
             with self.session_scope() as session:
                 obj = session.get(self.InventoryItem, item_id)
                 if obj:
                     session.delete(obj)
-            self.refresh_inventory_tree()
-            self.update_inventory_dropdown()
+            removed = self._rows_cache.pop(item_id, None)
+            self.model.remove_row(item_id)
+            if removed:
+                self._drop_dropdown_name(removed[1])
             if hasattr(self.app, 'billing_tab'):
+                self.app.billing_tab.invalidate_caches()
                 self.app.billing_tab.load_inventory_items()
             QMessageBox.information(self.app, self._("Success"), self._("Item deleted."))
 
     def modify_item(self):
-        selected = self.table.currentRow()
-        if selected < 0:
+        item_id = self.selected_item_id()
+        if item_id is None:
             QMessageBox.warning(self.app, self._("Warning"), self._("Please select an item to modify."))
             return
-        item_id = self.table.item(selected, 0).text()
-        from main import session_scope
         with self.session_scope() as session:
             obj = session.get(self.InventoryItem, item_id)
             if not obj:
@@ -436,10 +633,17 @@ class InventoryManagementTab(QWidget):
                         obj2.expiry_date = None
                     else:
                         obj2.expiry_date = e_expiry_date.date().toPyDate()
+                    row = (obj2.id, obj2.item_name, obj2.stock_count, obj2.purchase_price,
+                           obj2.selling_price, obj2.purchase_date, obj2.expiry_date)
+                old = self._rows_cache.get(item_id)
+                self._rows_cache[item_id] = row
+                self.model.replace_row(row)
+                if old and old[1] != row[1]:
+                    self._drop_dropdown_name(old[1])
+                    self._add_dropdown_name(row[1])
                 mod_win.accept()
-                self.refresh_inventory_tree()
-                self.update_inventory_dropdown()
                 if hasattr(self.app, 'billing_tab'):
+                    self.app.billing_tab.invalidate_caches()
                     self.app.billing_tab.load_inventory_items()
                 QMessageBox.information(self.app, self._("Success"), self._("Item details updated."))
             except Exception as ex:
@@ -451,10 +655,95 @@ class InventoryManagementTab(QWidget):
         mod_win.exec_()
 
     def bulk_import(self):
-        QMessageBox.information(self.app, self._("Bulk Import"), self._("Bulk import feature is not implemented yet."))
+        """Insert every row of a CSV file (columns as in CSV_FIELDS) in one transaction."""
+        try:
+            fname, _selected_filter = QFileDialog.getOpenFileName(
+                self, self._("Bulk Import"), "", "CSV Files (*.csv)"
+            )
+            if not fname:
+                return
+            names, stock_values, purchase_values, selling_values, purchase_dates, expiry_dates = [], [], [], [], [], []
+            with open(fname, newline="", encoding="utf-8") as f:
+                for line, record in enumerate(csv.DictReader(f), start=2):
+                    try:
+                        name = (record["item_name"] or "").strip()
+                        if not name:
+                            raise ValueError(self._("Item Name cannot be empty."))
+                        names.append(name)
+                        stock_values.append(float(record["stock_count"]))
+                        purchase_values.append(float(record["purchase_price"]))
+                        selling_values.append(float(record["selling_price"]))
+                        purchase_text = (record.get("purchase_date") or "").strip()
+                        purchase_dates.append(date.fromisoformat(purchase_text) if purchase_text else date.today())
+                        expiry_text = (record.get("expiry_date") or "").strip()
+                        expiry_dates.append(date.fromisoformat(expiry_text) if expiry_text else None)
+                    except (KeyError, TypeError, ValueError) as e:
+                        raise ValueError(self._("Line {line}: {error}").format(line=line, error=e))
+            if not names:
+                QMessageBox.information(self.app, self._("Bulk Import"), self._("No items found in the file."))
+                return
+            count = len(names)
+            stock = np.array(stock_values)
+            purchase = np.array(purchase_values)
+            selling = np.array(selling_values)
+            # Validate every row at once and report the first offending line.
+            checks = (
+                (stock != np.floor(stock), self._("Stock count must be a whole number.")),
+                (stock < 0, self._("Stock cannot be negative.")),
+                ((purchase <= 0) | (selling <= 0), self._("Prices must be positive.")),
+                (selling < purchase, self._("Selling price cannot be lower than purchase price.")),
+            )
+            for failed, message in checks:
+                bad = np.flatnonzero(failed)
+                if bad.size:
+                    raise ValueError(self._("Line {line}: {error}").format(line=int(bad[0]) + 2, error=message))
+            params = [
+                {"item_name": name, "stock_count": int(stock_count), "purchase_price": float(purchase_price),
+                 "selling_price": float(selling_price), "purchase_date": purchase_date, "expiry_date": expiry_date}
+                for name, stock_count, purchase_price, selling_price, purchase_date, expiry_date
+                in zip(names, stock, purchase, selling, purchase_dates, expiry_dates)
+            ]
+            self.bulk_insert(self.InventoryItem, params)
+            self.refresh_all()
+            if hasattr(self.app, 'billing_tab'):
+                self.app.billing_tab.invalidate_caches()
+                self.app.billing_tab.load_inventory_items()
+            QMessageBox.information(
+                self.app, self._("Bulk Import"),
+                self._("Imported {count} items.").format(count=count)
+            )
+        except Exception as e:
+            logging.exception("Error importing inventory")
+            QMessageBox.critical(self.app, self._("Error"), str(e))
 
     def bulk_export(self):
-        QMessageBox.information(self.app, self._("Bulk Export"), self._("Bulk export feature is not implemented yet."))
+        """Write the inventory to a CSV file that bulk_import can read back, streaming from the cursor."""
+        try:
+            fname, _selected_filter = QFileDialog.getSaveFileName(
+                self, self._("Bulk Export"), "", "CSV Files (*.csv)"
+            )
+            if not fname:
+                return
+            item = self.InventoryItem
+            stmt = select(
+                item.item_name, item.stock_count, item.purchase_price,
+                item.selling_price, item.purchase_date, item.expiry_date
+            ).order_by(item.id).execution_options(yield_per=self.EXPORT_CHUNK)
+            count = 0
+            with self.session_scope() as session, open(fname, "w", newline="", encoding="utf-8") as f:
+                writer = csv.writer(f)
+                writer.writerow(CSV_FIELDS)
+                for name, stock, purchase, selling, purchase_date, expiry in session.execute(stmt):
+                    writer.writerow((name, stock, purchase, selling, purchase_date.isoformat(),
+                                     expiry.isoformat() if expiry else ""))
+                    count += 1
+            QMessageBox.information(
+                self.app, self._("Bulk Export"),
+                self._("Exported {count} items.").format(count=count)
+            )
+        except Exception as e:
+            logging.exception("Error exporting inventory")
+            QMessageBox.critical(self.app, self._("Error"), str(e))
 
     def email_reminders(self):
         QMessageBox.information(self.app, self._("Email Reminders"), self._("Email reminders feature is not implemented yet."))
@@ -9,13 +9,21 @@ Rewritten with enhanced error handling and improved functionalities:
 
 import os
 import json
+import importlib
 import re
 import logging
 import configparser
-import shutil
-from datetime import date, datetime
+import sqlite3
+import time
+from datetime import date
 from contextlib import contextmanager
 
+try:
+    # orjson parses the raw UTF-8 bytes in C; its JSONDecodeError subclasses json's.
+    from orjson import loads as json_loads
+except ImportError:
+    json_loads = json.loads
+
 from PyQt5 import QtWidgets, QtCore
 from PyQt5.QtWidgets import (
     QMainWindow, QTabWidget, QVBoxLayout, QWidget, QAction, QMessageBox,
@@ -23,7 +31,7 @@ from PyQt5.QtWidgets import (
 )
 
 # Import shared styles.
-from styles import BUTTON_STYLE, HEADER_LABEL_STYLE, GROUPBOX_STYLE
+from styles import ROLE_STYLESHEET
 
 # Import settings constants.
 from settings import (
@@ -35,7 +43,7 @@ from settings import (
     WINDOW_TITLE,
     WINDOW_GEOMETRY,
     BG_COLOR,
-    PHONE_REGEX,
+    PHONE_REGEX_COMPILED,
     LOG_FORMAT,
     LOG_LEVEL,
     LOW_STOCK_THRESHOLD,
@@ -57,8 +65,8 @@ if not os.path.exists(TRANSLATIONS_FILE):
     raise FileNotFoundError(error_msg)
 
 try:
-    with open(TRANSLATIONS_FILE, encoding="utf-8") as f:
-        TRANSLATIONS = json.load(f)
+    with open(TRANSLATIONS_FILE, "rb") as f:
+        TRANSLATIONS = json_loads(f.read())
 except json.JSONDecodeError as e:
     error_msg = f"Failed to parse {TRANSLATIONS_FILE}: {e}"
     logging.error(error_msg)
@@ -68,8 +76,18 @@ except Exception as e:
     logging.error(error_msg)
     raise RuntimeError(error_msg)
 
-# Load or create configuration.
-config = configparser.ConfigParser()
+def write_config(parser):
+    """Write the configuration atomically: fill a temp file, fsync it, then swap it into place."""
+    tmp = CONFIG_FILE + ".tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        parser.write(f)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp, CONFIG_FILE)
+
+# Load or create configuration. The values are plain strings, so "%" interpolation is off: each
+# get() returns the stored text directly, and a "%" typed into a setting cannot break reading it.
+config = configparser.ConfigParser(interpolation=None)
 if os.path.exists(CONFIG_FILE):
     try:
         config.read(CONFIG_FILE, encoding="utf-8")
@@ -82,32 +100,50 @@ else:
         "theme": DEFAULT_THEME,
         "low_stock_threshold": str(LOW_STOCK_THRESHOLD),
         "currency": CURRENCY,
-        "backup_frequency": BACKUP_FREQUENCY,
+        "backup_frequency": str(BACKUP_FREQUENCY),
         "log_level": LOG_LEVEL
     }
     try:
-        with open(CONFIG_FILE, "w", encoding="utf-8") as f:
-            config.write(f)
+        write_config(config)
     except Exception as e:
         logging.exception("Failed to create configuration file")
         raise
 
 CURRENT_LANG = config.get("Settings", "language", fallback=DEFAULT_LANGUAGE)
 
+# Flat {key: text} map per language, built on first use, so a lookup is a single dict hit.
+_LANG_MAPS = {}
+_MISSING_KEYS = set()
+
+def _lang_map(lang: str) -> dict:
+    mapping = _LANG_MAPS.get(lang)
+    if mapping is None:
+        mapping = _LANG_MAPS[lang] = {
+            key: entry.get(lang, key) for key, entry in TRANSLATIONS.items() if entry
+        }
+    return mapping
+
 def _(key: str) -> str:
     """
     Retrieve the translation for a given key based on the current language.
-    Logs a warning if the key is not found.
+    Logs a warning the first time a key is not found.
     """
-    entry = TRANSLATIONS.get(key)
-    if entry:
-        return entry.get(CURRENT_LANG, key)
-    logging.warning(f"Translation key '{key}' not found.")
-    return key
+    text = _lang_map(CURRENT_LANG).get(key)
+    if text is None:
+        if key not in _MISSING_KEYS:
+            _MISSING_KEYS.add(key)
+            logging.warning(f"Translation key '{key}' not found.")
+        return key
+    return text
 
 # Database Setup using SQLAlchemy.
-from sqlalchemy import create_engine, Column, Integer, String, Float, Date, DateTime, ForeignKey, Index, Text
-from sqlalchemy.orm import relationship, declarative_base, sessionmaker
+from sqlalchemy import (create_engine, event, Column, Integer, String, Float, Date, DateTime, ForeignKey, Index, Text,
+                        bindparam, column, func, select, text)
+from sqlalchemy.orm import relationship, declarative_base, selectinload, sessionmaker
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.ext.hybrid import hybrid_property
+from sqlalchemy.schema import CreateIndex
+from sqlalchemy.pool import QueuePool
 
 Base = declarative_base()
 
@@ -173,7 +209,8 @@ class InventoryItem(Base):
     expiry_date = Column(Date, nullable=True)
     def __repr__(self):
         return f"<InventoryItem(name='{self.item_name}', stock={self.stock_count})>"
-    @property
+    # Usable in queries too, e.g. select(func.sum(InventoryItem.profit)) is summed by SQLite.
+    @hybrid_property
     def profit(self) -> float:
         return (self.selling_price - self.purchase_price) * self.stock_count
 
@@ -196,16 +233,124 @@ class ExpenseRecord(Base):
     def __repr__(self):
         return f"<ExpenseRecord(date='{self.date}', category='{self.category}', amount={self.amount})>"
 
+# Loader options for the tabs that walk these relationships: each level is fetched with one
+# "WHERE ... IN (...)" query instead of a lazy SELECT per parent row.
+USER_PETS_LOADER = selectinload(User.pets).selectinload(Pet.vaccines)
+VACCINE_OWNER_LOADER = selectinload(Vaccine.pet).selectinload(Pet.owner)
+
 Index('idx_phone', User.phone_number)
+# Child rows loaded through the User/Pet relationships (the owner/name pair also answers the
+# case-insensitive duplicate-pet check), and vaccines due on a given day.
+Index('idx_pet_owner_name', Pet.owner_id, func.lower(Pet.pet_name))
+Index('idx_vaccine_pet', Vaccine.pet_id, Vaccine.next_vaccine_date)
+Index('idx_vaccine_next_date', Vaccine.next_vaccine_date)
+Index('idx_appointment_user', Appointment.user_id, Appointment.appointment_datetime)
+Index('idx_appointment_pet', Appointment.pet_id, Appointment.appointment_datetime)
+# Date range filters in the analytics and billing views; they also carry the summed column,
+# so the sums are answered from the index alone.
+Index('idx_billing_date_total', BillingRecord.date, BillingRecord.total)
+Index('idx_expense_date_amount', ExpenseRecord.date, ExpenseRecord.amount)
+Index('idx_expense_category_date', ExpenseRecord.category, ExpenseRecord.date)
+# Upcoming-appointment count on the dashboard and the ordered appointments list.
+Index('idx_appointment_datetime', Appointment.appointment_datetime)
+# Inventory expiry and low-stock reminders; items without an expiry date never match.
+Index('idx_inventory_expiry', InventoryItem.expiry_date,
+      sqlite_where=InventoryItem.expiry_date.isnot(None))
+Index('idx_inventory_stock', InventoryItem.stock_count)
+
+# Applied to every new SQLite connection. WAL lets the dashboard/analytics readers run
+# alongside a writer, and NORMAL sync still never corrupts the database in WAL mode.
+SQLITE_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA mmap_size=268435456",
+    "PRAGMA cache_size=-20000",
+)
+
+# Full-text indexes for the patient search, as {table: indexed columns}; each lives in
+# "<table>_fts". The trigram tokenizer indexes every 3-character run, so a MATCH finds text
+# anywhere inside a value, like the substring search it replaces. They store no text of their
+# own (content='<table>'); triggers keep them in step with their table.
+FTS_TABLES = {
+    "users": ("user_name", "phone_number"),
+    "pets": ("pet_name",),
+}
+FTS_MIN_SQLITE = (3, 34, 0)  # First SQLite release with the trigram tokenizer.
+# Set once the FTS tables exist; without them (older SQLite, or a build without FTS5) the
+# search falls back to LIKE.
+FTS_SEARCH = False
+
+def _fts_ddl(table: str, columns: tuple) -> tuple:
+    fts = f"{table}_fts"
+    names = ", ".join(columns)
+    new_values = ", ".join(f"new.{c}" for c in columns)
+    old_values = ", ".join(f"old.{c}" for c in columns)
+    insert_new = f"INSERT INTO {fts}(rowid, {names}) VALUES (new.id, {new_values});"
+    delete_old = f"INSERT INTO {fts}({fts}, rowid, {names}) VALUES ('delete', old.id, {old_values});"
+    return (
+        f"CREATE VIRTUAL TABLE IF NOT EXISTS {fts} USING fts5({names}, content='{table}', content_rowid='id', "
+        f"tokenize='trigram')",
+        f"CREATE TRIGGER IF NOT EXISTS {fts}_ai AFTER INSERT ON {table} BEGIN {insert_new} END",
+        f"CREATE TRIGGER IF NOT EXISTS {fts}_ad AFTER DELETE ON {table} BEGIN {delete_old} END",
+        f"CREATE TRIGGER IF NOT EXISTS {fts}_au AFTER UPDATE OF {names} ON {table} BEGIN "
+        f"{delete_old} {insert_new} END",
+    )
+
+def _apply_sqlite_pragmas(dbapi_connection, connection_record):
+    cursor = dbapi_connection.cursor()
+    try:
+        for pragma in SQLITE_PRAGMAS:
+            cursor.execute(pragma)
+    finally:
+        cursor.close()
+
+# File-backed SQLite keeps its connections open in a pool, so the PRAGMAs above run once per
+# connection rather than per session. Each connection is used by one thread at a time.
+SQLITE_POOL_OPTIONS = {
+    "poolclass": QueuePool,
+    "pool_size": 4,  # GUI thread plus the dashboard, inventory and backup workers.
+    "max_overflow": 4,
+    "connect_args": {"check_same_thread": False},
+}
 
 try:
-    engine = create_engine(DB_URL, echo=False)
+    engine = create_engine(
+        DB_URL, echo=False, **(SQLITE_POOL_OPTIONS if DB_URL.startswith("sqlite:///") else {})
+    )
+    if DB_URL.startswith("sqlite"):
+        event.listen(engine, "connect", _apply_sqlite_pragmas)
     Base.metadata.create_all(engine)
+    with engine.begin() as conn:
+        # create_all skips tables that already exist, along with their indexes, so add any
+        # index an older database is missing. IF NOT EXISTS also covers expression indexes,
+        # which reflection (and so checkfirst) cannot see.
+        for table in Base.metadata.sorted_tables:
+            for index in table.indexes:
+                conn.execute(CreateIndex(index, if_not_exists=True))
+        if DB_URL.startswith("sqlite") and sqlite3.sqlite_version_info >= FTS_MIN_SQLITE:
+            try:
+                # A savepoint, so a failed CREATE leaves no half-built FTS tables behind.
+                with conn.begin_nested():
+                    for table, columns in FTS_TABLES.items():
+                        fts_exists = conn.exec_driver_sql(
+                            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?", (f"{table}_fts",)
+                        ).first()
+                        for statement in _fts_ddl(table, columns):
+                            conn.exec_driver_sql(statement)
+                        if not fts_exists:
+                            # Index the rows that were added before the table existed.
+                            conn.exec_driver_sql(f"INSERT INTO {table}_fts({table}_fts) VALUES ('rebuild')")
+                FTS_SEARCH = True
+            except OperationalError:
+                logging.warning("Full-text search is unavailable; the patient search uses LIKE", exc_info=True)
 except Exception as e:
     logging.exception("Database initialization failed")
     raise
 
-Session = sessionmaker(bind=engine)
+# Sessions never outlive their scope, so there is nothing to refresh after a commit;
+# keeping loaded attributes lets callers read returned objects once the session is closed.
+Session = sessionmaker(bind=engine, expire_on_commit=False)
 
 @contextmanager
 def session_scope():
@@ -224,41 +369,160 @@ def session_scope():
     finally:
         session.close()
 
+@contextmanager
+def read_scope():
+    """
+    Provide a session for read-only lookups; nothing is committed.
+    """
+    session = Session()
+    try:
+        yield session
+    finally:
+        session.close()
+
+def bulk_insert(model, rows):
+    """
+    Insert a list of column dicts into model's table with one Core executemany in one transaction,
+    skipping the ORM unit of work.
+    """
+    if not rows:
+        return
+    with engine.begin() as conn:
+        conn.execute(model.__table__.insert(), rows)
+
+# Users whose name or phone number, and pets whose name, contains the searched text (case-
+# insensitively). Built once with the bound parameters "q" and "like"; fill them with
+# user_search_params(). Text of 3 or more characters is answered from users_fts / pets_fts; shorter
+# text is below the trigram size and falls back to LIKE. Without FTS_SEARCH, ILIKE is used throughout.
+if FTS_SEARCH:
+    USER_SEARCH_CLAUSE = User.id.in_(
+        text(
+            "SELECT rowid FROM users_fts WHERE users_fts MATCH :q UNION ALL "
+            "SELECT id FROM users WHERE :like IS NOT NULL AND (user_name LIKE :like OR phone_number LIKE :like)"
+        ).columns(column("rowid", Integer))
+    )
+    PET_SEARCH_CLAUSE = Pet.id.in_(
+        text(
+            "SELECT rowid FROM pets_fts WHERE pets_fts MATCH :q UNION ALL "
+            "SELECT id FROM pets WHERE :like IS NOT NULL AND pet_name LIKE :like"
+        ).columns(column("rowid", Integer))
+    )
+else:
+    USER_SEARCH_CLAUSE = User.user_name.ilike(bindparam("like")) | User.phone_number.ilike(bindparam("like"))
+    PET_SEARCH_CLAUSE = Pet.pet_name.ilike(bindparam("like"))
+
+def user_search_params(query: str) -> dict:
+    """Bind values for USER_SEARCH_CLAUSE and PET_SEARCH_CLAUSE, matching query anywhere in the text."""
+    like = f"%{query}%"
+    if not FTS_SEARCH:
+        return {"like": like}
+    if len(query) < 3:
+        return {"q": '""', "like": like}  # An empty phrase matches no FTS row.
+    # The whole query as one quoted phrase; with the trigram tokenizer this is a substring match.
+    return {"q": '"' + query.replace('"', '""') + '"', "like": None}
+
+_USERS_SEARCH = select(User).options(USER_PETS_LOADER).where(USER_SEARCH_CLAUSE)
+
+def search_users(prefix: str):
+    """
+    Return the users whose name or phone number contains prefix (see USER_SEARCH_CLAUSE), with
+    their pets and vaccines loaded.
+    """
+    with read_scope() as s:
+        return s.execute(_USERS_SEARCH, user_search_params(prefix)).scalars().all()
+
 def validate_phone(phone: str) -> str | None:
     """
     Validate phone number against PHONE_REGEX.
     """
-    return phone if re.match(PHONE_REGEX, phone) else None
+    return phone if PHONE_REGEX_COMPILED.match(phone) else None
+
+BACKUP_PAGES_PER_STEP = 1000
+# Path of the SQLite database file, or None when DB_URL points at another kind of database.
+_DB_FILE = DB_URL[len("sqlite:///"):] if DB_URL.startswith("sqlite:///") else None
+
+def backup_sqlite(backup_file: str) -> None:
+    """
+    Copy the live database to backup_file with SQLite's online backup API.
+    Pages still in the write-ahead log are included, and writers are only held off
+    for one step of BACKUP_PAGES_PER_STEP pages at a time.
+    """
+    source = engine.raw_connection()
+    try:
+        target = sqlite3.connect(backup_file)
+        try:
+            source.driver_connection.backup(target, pages=BACKUP_PAGES_PER_STEP)
+        finally:
+            target.close()
+    finally:
+        source.close()
+
+class BackupSignals(QtCore.QObject):
+    """Signals emitted by BackupJob; delivered on the GUI thread."""
+    finished = QtCore.pyqtSignal(str)
+    failed = QtCore.pyqtSignal(str)
+
+class BackupJob(QtCore.QRunnable):
+    """Runs backup_sqlite on a QThreadPool thread so the window stays responsive."""
+
+    def __init__(self, backup_file: str):
+        super().__init__()
+        self.backup_file = backup_file
+        self.signals = BackupSignals()
+
+    def run(self):
+        try:
+            backup_sqlite(self.backup_file)
+            self.signals.finished.emit(self.backup_file)
+        except Exception as e:
+            logging.exception("Database backup failed")
+            self.signals.failed.emit(str(e))
+
+# Plain decimal numbers ("4", "4.5", ".5", "4."); anything else is rejected without raising.
+_WEIGHT_RE = re.compile(r"\d+(\.\d*)?|\.\d+")
 
 def validate_weight(weight: str) -> float | None:
     """
     Validate and convert weight to a positive float.
     """
-    try:
-        w = float(weight)
-        return w if w > 0 else None
-    except ValueError:
+    if not _WEIGHT_RE.fullmatch(weight):
         return None
+    w = float(weight)
+    return w if w > 0 else None
+
+# Built once; the phone number is a bound parameter, so every call reuses the compiled SQL.
+_USER_BY_PHONE = select(User).options(USER_PETS_LOADER).where(User.phone_number == bindparam("p"))
 
 def get_user_by_phone(phone: str):
     """
     Retrieve a user by their phone number from the database.
     """
-    with session_scope() as s:
-        return s.query(User).filter_by(phone_number=phone).first()
-
-# Import UI Tabs.
-from patient import PatientManagementTab
-from inventory import InventoryManagementTab
-from billing import BillingTab
-from analytics import AnalyticsTab
-from dashboard import DashboardTab   # New Tab.
-from appointments import AppointmentsTab   # New Tab.
+    with read_scope() as s:
+        return s.execute(_USER_BY_PHONE, {"p": phone}).scalar_one_or_none()
+
+# UI tabs in display order: (attribute, module, class, title). Each module is imported and its
+# tab built the first time the tab is opened, so e.g. matplotlib loads only with Analytics.
+TAB_SPECS = (
+    ("dashboard_tab", "dashboard", "DashboardTab", "Dashboard"),
+    ("patient_tab", "patient", "PatientManagementTab", "Patients"),
+    ("inventory_tab", "inventory", "InventoryManagementTab", "Manage Inventory"),
+    ("billing_tab", "billing", "BillingTab", "Billing"),
+    ("analytics_tab", "analytics", "AnalyticsTab", "Analytics"),
+    ("appointments_tab", "appointments", "AppointmentsTab", "Appointments"),
+)
 
 class VetClinicApp(QMainWindow):
     def __init__(self):
         super().__init__()
         self._ = _
+        # Tabs read the language from here: when run as a script this module is __main__, and their
+        # "from main import ..." loads a second copy whose CURRENT_LANG never changes.
+        self.CURRENT_LANG = CURRENT_LANG
+        self._backup_job = None
+        # Parsed once for the whole application; widgets opt in with setProperty("role", ...).
+        qt_app = QtWidgets.QApplication.instance()
+        if ROLE_STYLESHEET not in qt_app.styleSheet():
+            qt_app.setStyleSheet(qt_app.styleSheet() + ROLE_STYLESHEET)
         self.setWindowTitle(_(WINDOW_TITLE))
         self.setGeometry(100, 100, 1100, 700)
         central_widget = QWidget()
@@ -267,21 +531,11 @@ class VetClinicApp(QMainWindow):
         self.tab_widget = QTabWidget()
         main_layout.addWidget(self.tab_widget)
 
-        # Initialize tabs.
-        self.dashboard_tab = DashboardTab(self)
-        self.patient_tab = PatientManagementTab(self)
-        self.inventory_tab = InventoryManagementTab(self)
-        self.billing_tab = BillingTab(self)
-        self.analytics_tab = AnalyticsTab(self)
-        self.appointments_tab = AppointmentsTab(self)
-
-        # Add tabs in desired order.
-        self.tab_widget.addTab(self.dashboard_tab, _("Dashboard"))
-        self.tab_widget.addTab(self.patient_tab, _("Patients"))
-        self.tab_widget.addTab(self.inventory_tab, _("Manage Inventory"))
-        self.tab_widget.addTab(self.billing_tab, _("Billing"))
-        self.tab_widget.addTab(self.analytics_tab, _("Analytics"))
-        self.tab_widget.addTab(self.appointments_tab, _("Appointments"))
+        # Add placeholder tabs in desired order; the real tab replaces its placeholder on first open.
+        for _attr, _module, _cls, title in TAB_SPECS:
+            self.tab_widget.addTab(QWidget(), _(title))
+        self.tab_widget.currentChanged.connect(self._ensure_tab_loaded)
+        self._ensure_tab_loaded(self.tab_widget.currentIndex())
 
         # Setup menu actions.
         settings_action = QAction(_("Settings"), self)
@@ -293,6 +547,38 @@ class VetClinicApp(QMainWindow):
         settings_menu.addAction(settings_action)
         menubar.addAction(backup_action)
 
+    @property
+    def _tabs(self):
+        """The tabs built so far, in display order."""
+        return tuple(getattr(self, attr) for attr, *_rest in TAB_SPECS if hasattr(self, attr))
+
+    def _ensure_tab_loaded(self, index):
+        """Import and build the tab at index the first time it is shown."""
+        if not 0 <= index < len(TAB_SPECS):
+            return
+        attr, module_name, class_name, title = TAB_SPECS[index]
+        if hasattr(self, attr):
+            return
+        try:
+            tab = getattr(importlib.import_module(module_name), class_name)(self)
+        except Exception as e:
+            # This runs in the currentChanged slot, where an exception would abort the app; keep the
+            # placeholder page instead, and retry the next time the tab is opened.
+            logging.exception(f"Failed to load the {title} tab")
+            QMessageBox.critical(self, _("Error"), f"{_('Failed to load tab')} {_(title)}: {e}")
+            return
+        setattr(self, attr, tab)
+        placeholder = self.tab_widget.widget(index)
+        # Swapping the page would emit currentChanged again; the tab is already current.
+        self.tab_widget.blockSignals(True)
+        try:
+            self.tab_widget.removeTab(index)
+            self.tab_widget.insertTab(index, tab, _(title))
+            self.tab_widget.setCurrentIndex(index)
+        finally:
+            self.tab_widget.blockSignals(False)
+        placeholder.deleteLater()
+
     def open_settings(self):
         """
         Open the settings dialog with unified styling.
@@ -300,46 +586,49 @@ class VetClinicApp(QMainWindow):
         dialog = QtWidgets.QDialog(self)
         dialog.setWindowTitle(_("Settings"))
         layout = QVBoxLayout(dialog)
+        if not config.has_section("Settings"):
+            config.add_section("Settings")
+        settings = config["Settings"]
 
         # Use a group box to wrap settings.
         settings_group = QtWidgets.QGroupBox(_("Application Settings"))
-        settings_group.setStyleSheet(GROUPBOX_STYLE)
+        settings_group.setProperty("role", "group")
         group_layout = QVBoxLayout(settings_group)
 
         # Theme
         theme_label = QLabel(_("Theme"))
-        theme_label.setStyleSheet(HEADER_LABEL_STYLE)
+        theme_label.setProperty("role", "header")
         themes = ["default"]  # Future themes can be added here.
         theme_combo = QComboBox()
         theme_combo.addItems(themes)
-        theme_combo.setCurrentText(config.get("Settings", "theme", fallback=DEFAULT_THEME))
+        theme_combo.setCurrentText(settings.get("theme", DEFAULT_THEME))
 
         # Language
         lang_label = QLabel(_("Language"))
-        lang_label.setStyleSheet(HEADER_LABEL_STYLE)
+        lang_label.setProperty("role", "header")
         lang_combo = QComboBox()
         lang_combo.addItems(["English", "Arabic"])
-        current_lang = "Arabic" if config.get("Settings", "language", fallback=DEFAULT_LANGUAGE) == "ar" else "English"
+        current_lang = "Arabic" if settings.get("language", DEFAULT_LANGUAGE) == "ar" else "English"
         lang_combo.setCurrentText(current_lang)
 
         # Other settings
         low_stock_label = QLabel(_("Low Stock Threshold"))
-        low_stock_label.setStyleSheet(HEADER_LABEL_STYLE)
+        low_stock_label.setProperty("role", "header")
         low_stock_entry = QLineEdit()
-        low_stock_entry.setText(config.get("Settings", "low_stock_threshold", fallback=str(LOW_STOCK_THRESHOLD)))
+        low_stock_entry.setText(settings.get("low_stock_threshold", str(LOW_STOCK_THRESHOLD)))
         currency_label = QLabel(_("Currency"))
-        currency_label.setStyleSheet(HEADER_LABEL_STYLE)
+        currency_label.setProperty("role", "header")
         currency_entry = QLineEdit()
-        currency_entry.setText(config.get("Settings", "currency", fallback=CURRENCY))
+        currency_entry.setText(settings.get("currency", CURRENCY))
         backup_label = QLabel(_("Backup Frequency (days)"))
-        backup_label.setStyleSheet(HEADER_LABEL_STYLE)
+        backup_label.setProperty("role", "header")
         backup_entry = QLineEdit()
-        backup_entry.setText(config.get("Settings", "backup_frequency", fallback=BACKUP_FREQUENCY))
+        backup_entry.setText(settings.get("backup_frequency", str(BACKUP_FREQUENCY)))
         log_level_label = QLabel(_("Log Level"))
-        log_level_label.setStyleSheet(HEADER_LABEL_STYLE)
+        log_level_label.setProperty("role", "header")
         log_level_combo = QComboBox()
         log_level_combo.addItems(["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"])
-        log_level_combo.setCurrentText(config.get("Settings", "log_level", fallback=LOG_LEVEL))
+        log_level_combo.setCurrentText(settings.get("log_level", LOG_LEVEL))
 
         # Add widgets to group layout.
         group_layout.addWidget(theme_label)
@@ -358,33 +647,34 @@ class VetClinicApp(QMainWindow):
 
         # Apply button.
         btn_apply = QPushButton(_("Apply"))
-        btn_apply.setStyleSheet(BUTTON_STYLE)
+        btn_apply.setProperty("role", "button")
         layout.addWidget(btn_apply)
 
         def apply_settings():
             try:
                 new_lang = "ar" if lang_combo.currentText() == "Arabic" else "en"
                 global CURRENT_LANG
-                CURRENT_LANG = new_lang
-                config["Settings"]["language"] = new_lang
-                config["Settings"]["theme"] = theme_combo.currentText()
-                config["Settings"]["low_stock_threshold"] = low_stock_entry.text()
-                config["Settings"]["currency"] = currency_entry.text()
-                config["Settings"]["backup_frequency"] = backup_entry.text()
-                config["Settings"]["log_level"] = log_level_combo.currentText()
-
-                with open(CONFIG_FILE, "w", encoding="utf-8") as f:
-                    config.write(f)
-
-                # Refresh language for all tabs.
-                self.patient_tab.refresh_language()
-                self.appointments_tab.refresh_language()
-                self.inventory_tab.refresh_language()
-                self.billing_tab.refresh_language()
-                self.analytics_tab.refresh_language()
-                if hasattr(self.dashboard_tab, 'refresh_language'):
-                    self.dashboard_tab.refresh_language()
-                
+                CURRENT_LANG = self.CURRENT_LANG = new_lang
+                settings.update({
+                    "language": new_lang,
+                    "theme": theme_combo.currentText(),
+                    "low_stock_threshold": low_stock_entry.text(),
+                    "currency": currency_entry.text(),
+                    "backup_frequency": backup_entry.text(),
+                    "log_level": log_level_combo.currentText(),
+                })
+
+                write_config(config)
+
+                # Refresh language for all tabs, repainting the window once at the end.
+                self.setUpdatesEnabled(False)
+                try:
+                    for tab in self._tabs:
+                        if hasattr(tab, 'refresh_language'):
+                            tab.refresh_language()
+                finally:
+                    self.setUpdatesEnabled(True)
+
 
                 QMessageBox.information(self, _("Settings"), _("Settings applied successfully."))
                 dialog.accept()
@@ -401,16 +691,16 @@ class VetClinicApp(QMainWindow):
         For non-SQLite databases, informs the user that automatic backup is not supported.
         """
         try:
-            if DB_URL.startswith("sqlite:///"):
-                db_file = DB_URL.replace("sqlite:///", "")
-                if os.path.exists(db_file):
-                    backup_file = f"{db_file}.{datetime.now().strftime('%Y%m%d%H%M%S')}.bak"
-                    shutil.copy(db_file, backup_file)
-                    QMessageBox.information(
-                        self,
-                        _("Backup Database"),
-                        _("Database successfully backed up to ") + backup_file
-                    )
+            if _DB_FILE is not None:
+                if self._backup_job is not None:
+                    return  # A backup is already running.
+                if os.path.exists(_DB_FILE):
+                    backup_file = f"{_DB_FILE}.{time.strftime('%Y%m%d%H%M%S')}.bak"
+                    job = BackupJob(backup_file)
+                    job.signals.finished.connect(self._on_backup_finished)
+                    job.signals.failed.connect(self._on_backup_failed)
+                    self._backup_job = job
+                    QtCore.QThreadPool.globalInstance().start(job)
                 else:
                     QMessageBox.warning(self, _("Backup Database"), _("Database file not found for backup."))
             else:
@@ -423,6 +713,18 @@ class VetClinicApp(QMainWindow):
             logging.exception("Database backup failed")
             QMessageBox.critical(self, _("Backup Database"), _("Failed to backup database: ") + str(e))
 
+    def _on_backup_finished(self, backup_file):
+        self._backup_job = None
+        QMessageBox.information(
+            self,
+            _("Backup Database"),
+            _("Database successfully backed up to ") + backup_file
+        )
+
+    def _on_backup_failed(self, message):
+        self._backup_job = None
+        QMessageBox.critical(self, _("Backup Database"), _("Failed to backup database: ") + message)
+
 if __name__ == "__main__":
     try:
         import sys
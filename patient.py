@@ -5,13 +5,15 @@ from datetime import date, timedelta
 
 from PyQt5 import QtWidgets, QtCore
 from PyQt5.QtCore import QDate
-from PyQt5.QtGui import QBrush, QColor
+from PyQt5.QtGui import QBrush, QColor, QTextCharFormat
 from PyQt5.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QPushButton, QLineEdit, QLabel,
     QTreeWidget, QTreeWidgetItem, QDialog, QMessageBox, QComboBox,
-    QDateEdit, QListWidget, QDialogButtonBox
+    QDateEdit, QListWidget, QDialogButtonBox, QCompleter
 )
 
+from sqlalchemy import func, select
+
 from styles import BUTTON_STYLE, GROUPBOX_STYLE, HEADER_LABEL_STYLE, LISTSTYLE
 
 # Vaccine options per pet type.
@@ -22,25 +24,73 @@ VACCINES_BY_TYPE = {
     "Other": ["Other"],
 }
 
+# "Next Vaccine In" choices and the interval each one adds to the vaccine date.
+NEXT_VACCINE_INTERVALS = {
+    "1 week": timedelta(weeks=1),
+    "2 weeks": timedelta(weeks=2),
+    "3 weeks": timedelta(weeks=3),
+    "1 month": timedelta(days=30),
+    "1 year": timedelta(days=365),
+}
+
+# Calendar cell format for days with a vaccine due.
+VACCINE_DUE_FORMAT = QTextCharFormat()
+VACCINE_DUE_FORMAT.setBackground(QtCore.Qt.yellow)
+
+# Translation keys of the record tree columns, in column order.
+HEADER_KEYS = (
+    "Name", "Phone", "Pet", "Type", "Gender", "Age (Months)",
+    "Weight", "Vaccine Type", "Vaccine Date", "Next Vaccine Date",
+)
+AGE_COLUMN = HEADER_KEYS.index("Age (Months)")
+WEIGHT_COLUMN = HEADER_KEYS.index("Weight")
+NUMERIC_COLUMNS = (AGE_COLUMN, WEIGHT_COLUMN)
+
+class RecordTreeItem(QTreeWidgetItem):
+    """Record row whose age and weight columns sort by the number kept in Qt.UserRole, not their text."""
+
+    def __lt__(self, other):
+        column = self.treeWidget().sortColumn()
+        if column in NUMERIC_COLUMNS:
+            return self.data(column, QtCore.Qt.UserRole) < other.data(column, QtCore.Qt.UserRole)
+        return super().__lt__(other)
+
 def show_error(widget, title, message):
     """Helper to display an error message and log it."""
     logging.error(message)
     QMessageBox.critical(widget, title, message)
 
 class PatientManagementTab(QWidget):
+    SEARCH_DEBOUNCE_MS = 250
+    _records_select = None  # Flat tree-row SELECT, built on first use.
+    _search_select = None  # The same SELECT filtered by the bound search parameters.
+
     def __init__(self, app):
         super().__init__()
         # Import required objects from main.
-        from main import session_scope, User, Pet, Vaccine, _, validate_phone, validate_weight, CURRENT_LANG
+        from main import (session_scope, User, Pet, Vaccine, validate_phone, validate_weight,
+                          VACCINE_OWNER_LOADER, USER_SEARCH_CLAUSE, PET_SEARCH_CLAUSE, user_search_params)
         self.app = app
         self.session_scope = session_scope
+        self.user_search_clause = USER_SEARCH_CLAUSE
+        self.pet_search_clause = PET_SEARCH_CLAUSE
+        self.user_search_params = user_search_params
+        self.vaccine_owner_loader = VACCINE_OWNER_LOADER
         self.User = User
         self.Pet = Pet
         self.Vaccine = Vaccine
-        self._ = _
+        # The app's translator and language, not main's: the tab may be built after a language change.
+        self._ = app._
         self.validate_phone = validate_phone
         self.validate_weight = validate_weight
-        self.rtl = (CURRENT_LANG == "ar")
+        self.rtl = (app.CURRENT_LANG == "ar")
+        self._lang = app.CURRENT_LANG  # Language the labels were last translated into.
+        # Vaccine reminder lines for _reminders_date, and the calendar's {date: entries} map;
+        # both are rebuilt after this tab changes a pet or its vaccines.
+        self._reminders_date = None
+        self._reminders = None
+        self._calendar_entries = None
+        self._shown_query = None  # Search text of the rows in the tree ("" for the full listing).
         self.init_ui()
 
     def init_ui(self):
@@ -70,7 +120,7 @@ class PatientManagementTab(QWidget):
 
         self.btn_refresh = QPushButton(self._("🔁 Refresh Records"))
         self.btn_refresh.setStyleSheet(BUTTON_STYLE)
-        self.btn_refresh.clicked.connect(self.show_records)
+        self.btn_refresh.clicked.connect(self.refresh_records)
 
         for btn in [self.btn_add_pet, self.btn_delete_pet, self.btn_modify_record,
                     self.btn_vaccine_rem, self.btn_calendar, self.btn_refresh]:
@@ -83,9 +133,21 @@ class PatientManagementTab(QWidget):
         self.lbl_search.setStyleSheet(HEADER_LABEL_STYLE)
         self.search_entry = QLineEdit()
         self.search_entry.setStyleSheet("font-size: 16px; padding: 5px;")
+        # Suggestions come from the names and phones of the last full listing; typing never queries.
+        self._completer_model = QtCore.QStringListModel(self)
+        completer = QCompleter(self._completer_model, self)
+        completer.setCaseSensitivity(QtCore.Qt.CaseInsensitive)
+        completer.setModelSorting(QCompleter.CaseInsensitivelySortedModel)
+        self.search_entry.setCompleter(completer)
         self.btn_go = QPushButton(self._("Go"))
         self.btn_go.setStyleSheet(BUTTON_STYLE)
+        # Enter only arms the timer, so a burst of presses runs one search; Go always searches.
+        self._search_timer = QtCore.QTimer(self)
+        self._search_timer.setSingleShot(True)
+        self._search_timer.setInterval(self.SEARCH_DEBOUNCE_MS)
+        self._search_timer.timeout.connect(self._debounced_search)
         self.btn_go.clicked.connect(self.search_records)
+        self.search_entry.returnPressed.connect(self._search_timer.start)
         search_layout.addWidget(self.lbl_search)
         search_layout.addWidget(self.search_entry)
         search_layout.addWidget(self.btn_go)
@@ -95,12 +157,7 @@ class PatientManagementTab(QWidget):
         self.tree = QTreeWidget()
         self.tree.setStyleSheet(LISTSTYLE)
         self.tree.setColumnCount(10)
-        self.tree.setHeaderLabels([
-            self._("Name"), self._("Phone"), self._("Pet"),
-            self._("Type"), self._("Gender"), self._("Age (Months)"),
-            self._("Weight"), self._("Vaccine Type"), self._("Vaccine Date"),
-            self._("Next Vaccine Date")
-        ])
+        self.tree.setHeaderLabels([self._(key) for key in HEADER_KEYS])
         self.tree.setSortingEnabled(True)
         self.tree.setSelectionMode(QtWidgets.QAbstractItemView.ExtendedSelection)
         layout.addWidget(self.tree)
@@ -109,10 +166,10 @@ class PatientManagementTab(QWidget):
         self.setLayout(layout)
 
     def refresh_language(self):
-        try:
-            _ = self.app._
-        except AttributeError:
-            from main import _
+        if self.app.CURRENT_LANG == self._lang:
+            return  # Settings were applied without changing the language.
+        self._lang = self.app.CURRENT_LANG
+        _ = self.app._
         self.btn_add_pet.setText(_( "➕ Add Pet"))
         self.btn_delete_pet.setText(_( "🗑 Delete Pet"))
         self.btn_modify_record.setText(_( "✏️ Modify Record"))
@@ -121,60 +178,97 @@ class PatientManagementTab(QWidget):
         self.btn_refresh.setText(_( "🔁 Refresh Records"))
         self.lbl_search.setText(_( "Search:"))
         self.btn_go.setText(_( "Go"))
-        headers = [
-            _( "Name"), _( "Phone"), _( "Pet"),
-            _( "Type"), _( "Gender"), _( "Age (Months)"),
-            _( "Weight"), _( "Vaccine Type"), _( "Vaccine Date"),
-            _( "Next Vaccine Date")
-        ]
-        self.tree.setHeaderLabels(headers)
-        self.show_records()
+        # The rows hold patient data only, so only the headers need translating.
+        self.tree.setHeaderLabels([_(key) for key in HEADER_KEYS])
 
     def clear_tree(self):
         self.tree.clear()
 
+    @classmethod
+    def _select_records(cls, User, Pet, Vaccine):
+        """One row per pet in tree column order plus the pet id, joined to the pet's latest vaccine (if any)."""
+        if cls._records_select is None:
+            ranked = select(
+                Vaccine.pet_id, Vaccine.vaccine_type, Vaccine.vaccine_date, Vaccine.next_vaccine_date,
+                func.row_number().over(
+                    partition_by=Vaccine.pet_id, order_by=(Vaccine.vaccine_date.desc(), Vaccine.id)
+                ).label("rank")
+            ).subquery()
+            cls._records_select = (
+                select(
+                    User.user_name, User.phone_number, Pet.pet_name, Pet.type, Pet.gender, Pet.age,
+                    Pet.weight, ranked.c.vaccine_type, ranked.c.vaccine_date, ranked.c.next_vaccine_date,
+                    Pet.id
+                )
+                .join(Pet, Pet.owner_id == User.id)
+                .outerjoin(ranked, (ranked.c.pet_id == Pet.id) & (ranked.c.rank == 1))
+                .order_by(User.id, Pet.id)
+            )
+        return cls._records_select
+
+    @classmethod
+    def _select_search_records(cls, User, Pet, Vaccine, user_search_clause, pet_search_clause):
+        """Tree rows of users matching the search box by name, phone or one of their pets' names."""
+        if cls._search_select is None:
+            cls._search_select = cls._select_records(User, Pet, Vaccine).where(
+                user_search_clause | User.pets.any(pet_search_clause)
+            )
+        return cls._search_select
+
     def show_records(self, query=None):
         """Display user and pet records, optionally filtered by query."""
         try:
-            self.clear_tree()
+            if query:
+                stmt = self._select_search_records(
+                    self.User, self.Pet, self.Vaccine, self.user_search_clause, self.pet_search_clause
+                )
+                params = self.user_search_params(query)
+            else:
+                stmt = self._select_records(self.User, self.Pet, self.Vaccine)
+                params = {}
             with self.session_scope() as session:
-                q = session.query(self.User)
-                if query:
-                    q = q.filter(
-                        (self.User.user_name.ilike(f"%{query}%")) |
-                        (self.User.phone_number.ilike(f"%{query}%")) |
-                        (self.User.pets.any(self.Pet.pet_name.ilike(f"%{query}%")))
-                    )
-                users = q.all()
-                for user in users:
-                    for pet in user.pets:
-                        if hasattr(pet, "vaccines") and pet.vaccines:
-                            latest = sorted(pet.vaccines, key=lambda v: v.vaccine_date, reverse=True)[0]
-                            vaccine_type = latest.vaccine_type
-                            vaccine_date_str = latest.vaccine_date.strftime("%Y-%m-%d")
-                            next_vaccine_date_str = (latest.next_vaccine_date.strftime("%Y-%m-%d")
-                                                     if latest.next_vaccine_date else "")
-                        else:
-                            vaccine_type = ""
-                            vaccine_date_str = ""
-                            next_vaccine_date_str = ""
-                        item = QTreeWidgetItem([
-                            user.user_name,
-                            user.phone_number,
-                            pet.pet_name,
-                            pet.type,
-                            pet.gender,
-                            str(pet.age),
-                            str(pet.weight),
-                            vaccine_type,
-                            vaccine_date_str,
-                            next_vaccine_date_str
-                        ])
-                        # Highlight if vaccine is due today.
-                        if next_vaccine_date_str and date.today().strftime("%Y-%m-%d") == next_vaccine_date_str:
-                            for i in range(item.columnCount()):
-                                item.setBackground(i, QBrush(QColor("yellow")))
-                        self.tree.addTopLevelItem(item)
+                rows = session.execute(stmt, params).all()
+            today = date.today()
+            highlight = QBrush(QColor("yellow"))
+            columns = range(len(HEADER_KEYS))
+            items = []
+            for (user_name, phone, pet_name, pet_type, gender, age, weight,
+                 vaccine_type, vaccine_date, next_vaccine_date, pet_id) in rows:
+                item = RecordTreeItem([
+                    user_name,
+                    phone,
+                    pet_name,
+                    pet_type,
+                    gender,
+                    str(age),
+                    str(weight),
+                    vaccine_type or "",
+                    vaccine_date.isoformat() if vaccine_date else "",
+                    next_vaccine_date.isoformat() if next_vaccine_date else ""
+                ])
+                # The numbers themselves, so these columns sort numerically (see RecordTreeItem).
+                item.setData(AGE_COLUMN, QtCore.Qt.UserRole, age)
+                item.setData(WEIGHT_COLUMN, QtCore.Qt.UserRole, weight)
+                # Delete and modify find the pet by this id.
+                item.setData(0, QtCore.Qt.UserRole, pet_id)
+                # Highlight if vaccine is due today.
+                if next_vaccine_date == today:
+                    for i in columns:
+                        item.setBackground(i, highlight)
+                items.append(item)
+            # Swap the rows in with sorting and painting off, so the tree sorts and repaints once.
+            self.tree.setSortingEnabled(False)
+            self.tree.setUpdatesEnabled(False)
+            try:
+                self.clear_tree()
+                self.tree.addTopLevelItems(items)
+            finally:
+                self.tree.setSortingEnabled(True)
+                self.tree.setUpdatesEnabled(True)
+            self._shown_query = query or ""
+            if not query:
+                suggestions = {row[0] for row in rows} | {row[1] for row in rows}
+                self._completer_model.setStringList(sorted(suggestions, key=str.lower))
         except Exception as e:
             show_error(self.app, self._("Error"), self._("Failed to display records: ") + str(e))
 
@@ -185,6 +279,19 @@ class PatientManagementTab(QWidget):
             return None
         return items[0]
 
+    def _insert_vaccines(self, session, pet_id, records):
+        """Insert the dialog's vaccine records for pet_id with one executemany in the caller's transaction."""
+        if records:
+            session.execute(self.Vaccine.__table__.insert(), [
+                {
+                    "pet_id": pet_id,
+                    "vaccine_type": record["vaccine_type"],
+                    "vaccine_date": record["vaccine_date"],
+                    "next_vaccine_date": record["next_vaccine_date"]
+                }
+                for record in records
+            ])
+
     def open_vaccine_dialog(self, pet_type: str):
         """Display a dialog for adding a vaccine record for a pet."""
         dialog = QDialog(self.app)
@@ -202,7 +309,7 @@ class PatientManagementTab(QWidget):
         vaccine_date_edit.setCalendarPopup(True)
         vaccine_date_edit.setDate(QDate.currentDate())
         next_vaccine_combo = QComboBox()
-        next_vaccine_combo.addItems(["1 week", "2 weeks", "3 weeks", "1 month", "1 year"])
+        next_vaccine_combo.addItems(list(NEXT_VACCINE_INTERVALS))
 
         form.addRow(self._("Vaccine Type"), vaccine_type_combo)
         form.addRow(self._("Specify Vaccine Type"), custom_entry)
@@ -244,19 +351,7 @@ class PatientManagementTab(QWidget):
                     vaccine_type = vaccine_type_combo.currentText()
 
                 vaccine_date = vaccine_date_edit.date().toPyDate()
-                next_str = next_vaccine_combo.currentText()
-                if "1 week" in next_str:
-                    td = timedelta(weeks=1)
-                elif "2 weeks" in next_str:
-                    td = timedelta(weeks=2)
-                elif "3 weeks" in next_str:
-                    td = timedelta(weeks=3)
-                elif "1 month" in next_str:
-                    td = timedelta(days=30)
-                elif "1 year" in next_str:
-                    td = timedelta(days=365)
-                else:
-                    td = timedelta(0)
+                td = NEXT_VACCINE_INTERVALS.get(next_vaccine_combo.currentText(), timedelta(0))
                 next_vaccine_date = vaccine_date + td
                 return {
                     "vaccine_type": vaccine_type,
@@ -339,7 +434,11 @@ class PatientManagementTab(QWidget):
                     pet_name_val = pet_entry.text().strip()
                     if not pet_name_val:
                         raise ValueError(self._("Pet name cannot be empty."))
-                    if any(p.pet_name.lower() == pet_name_val.lower() for p in user.pets):
+                    duplicate = session.query(self.Pet.id).filter(
+                        self.Pet.owner_id == user.id,
+                        func.lower(self.Pet.pet_name) == pet_name_val.lower()
+                    ).first()
+                    if duplicate is not None:
                         raise ValueError(self._("This pet already exists for this user."))
                     pet_type = type_combo.currentText()
                     gender = gender_combo.currentText()
@@ -362,22 +461,15 @@ class PatientManagementTab(QWidget):
                     )
                     session.add(new_pet)
                     session.flush()
-                    for record in vaccine_records:
-                        new_vaccine = self.Vaccine(
-                            pet=new_pet,
-                            vaccine_type=record["vaccine_type"],
-                            vaccine_date=record["vaccine_date"],
-                            next_vaccine_date=record["next_vaccine_date"]
-                        )
-                        session.add(new_vaccine)
+                    self._insert_vaccines(session, new_pet.id, vaccine_records)
+                self.invalidate_caches()
                 QMessageBox.information(
                     self.app, self._("Success"),
                     self._("Pet '{pet}' added successfully.").format(pet=pet_name_val)
                 )
                 dialog.accept()
                 self.show_records()
-                if hasattr(self.app, 'billing_tab'):
-                    self.app.billing_tab.load_patients()
+                self.refresh_billing_patients()
             except Exception as e:
                 show_error(dialog, self._("Error"), str(e))
         btn_save = QPushButton(self._("Save"))
@@ -390,7 +482,7 @@ class PatientManagementTab(QWidget):
         selected_item = self.get_selected_item()
         if not selected_item:
             return
-        phone = selected_item.text(1)
+        pet_id = selected_item.data(0, QtCore.Qt.UserRole)
         pet_name = selected_item.text(2)
         reply = QMessageBox.question(
             self.app,
@@ -401,11 +493,10 @@ class PatientManagementTab(QWidget):
         if reply == QMessageBox.Yes:
             try:
                 with self.session_scope() as session:
-                    user = session.query(self.User).filter_by(phone_number=phone).first()
-                    if user:
-                        pet = next((p for p in user.pets if p.pet_name.lower() == pet_name.lower()), None)
-                        if pet:
-                            session.delete(pet)
+                    pet = session.get(self.Pet, pet_id)
+                    if pet:
+                        session.delete(pet)
+                self.invalidate_caches()
                 QMessageBox.information(
                     self.app, self._("Deleted"),
                     self._("Pet '{pet}' deleted.").format(pet=pet_name)
@@ -418,17 +509,13 @@ class PatientManagementTab(QWidget):
         selected_item = self.get_selected_item()
         if not selected_item:
             return
-        phone = selected_item.text(1)
-        pet_name = selected_item.text(2)
+        pet_id = selected_item.data(0, QtCore.Qt.UserRole)
         try:
             with self.session_scope() as session:
-                user = session.query(self.User).filter_by(phone_number=phone).first()
-                if not user:
-                    raise ValueError(self._("User not found."))
-                pet_obj = next((p for p in user.pets if p.pet_name.lower() == pet_name.lower()), None)
+                pet_obj = session.get(self.Pet, pet_id)
                 if not pet_obj:
                     raise ValueError(self._("Pet not found."))
-                current_user_name = user.user_name
+                current_user_name = pet_obj.owner.user_name
                 pet_data = {
                     "pet_name": pet_obj.pet_name,
                     "type": pet_obj.type,
@@ -436,12 +523,10 @@ class PatientManagementTab(QWidget):
                     "age": pet_obj.age,
                     "weight": pet_obj.weight,
                 }
-                existing_vaccines = []
-                if hasattr(pet_obj, "vaccines"):
-                    for vac in pet_obj.vaccines:
-                        summary = f"{vac.vaccine_type} on {vac.vaccine_date.strftime('%Y-%m-%d')} (next: {vac.next_vaccine_date.strftime('%Y-%m-%d') if vac.next_vaccine_date else ''})"
-                        existing_vaccines.append(summary)
-                pet_id = pet_obj.id
+                existing_vaccines = [
+                    f"{vac.vaccine_type} on {vac.vaccine_date.strftime('%Y-%m-%d')} (next: {vac.next_vaccine_date.strftime('%Y-%m-%d') if vac.next_vaccine_date else ''})"
+                    for vac in pet_obj.vaccines
+                ]
         except Exception as e:
             show_error(self.app, self._("Error"), self._("Failed to retrieve record: ") + str(e))
             return
@@ -539,27 +624,21 @@ class PatientManagementTab(QWidget):
                 if new_weight is None:
                     raise ValueError(self._("Invalid weight. Enter a positive number."))
                 with self.session_scope() as session:
-                    user_to_update = session.query(self.User).filter_by(phone_number=phone).first()
-                    pet_to_update = session.query(self.Pet).get(pet_id)
-                    if user_to_update is None or pet_to_update is None:
+                    pet_to_update = session.get(self.Pet, pet_id)
+                    if pet_to_update is None:
                         raise ValueError(self._("Record not found in the database."))
-                    user_to_update.user_name = new_user_name
+                    pet_to_update.owner.user_name = new_user_name
                     pet_to_update.pet_name = new_pet_name
                     pet_to_update.type = new_type
                     pet_to_update.gender = new_gender
                     pet_to_update.age = int(new_age)
                     pet_to_update.weight = new_weight
-                    for record in new_vaccine_records:
-                        new_vac = self.Vaccine(
-                            pet=pet_to_update,
-                            vaccine_type=record["vaccine_type"],
-                            vaccine_date=record["vaccine_date"],
-                            next_vaccine_date=record["next_vaccine_date"]
-                        )
-                        session.add(new_vac)
+                    self._insert_vaccines(session, pet_to_update.id, new_vaccine_records)
+                self.invalidate_caches()
                 QMessageBox.information(self.app, self._("Success"), self._("Record updated successfully."))
                 dialog.accept()
                 self.show_records()
+                self.refresh_billing_patients()  # The owner's name may have changed.
             except Exception as ex:
                 show_error(dialog, self._("Error"), str(ex))
         btn_save = QPushButton(self._("Save Changes"))
@@ -568,26 +647,51 @@ class PatientManagementTab(QWidget):
         layout.addWidget(btn_save, row, 0, 1, 2)
         dialog.exec_()
 
+    def refresh_records(self):
+        """Reload the tree and forget cached reminders, e.g. after the database changed elsewhere."""
+        self.invalidate_caches()
+        self.show_records()
+
+    def refresh_billing_patients(self):
+        """Reload the billing tab's patient list after owners were added or renamed."""
+        if hasattr(self.app, 'billing_tab'):
+            self.app.billing_tab.invalidate_caches()
+            self.app.billing_tab.load_patients()
+
+    def invalidate_caches(self):
+        """Drop the cached reminders and calendar entries after pets or vaccines change."""
+        self._reminders_date = None
+        self._reminders = None
+        self._calendar_entries = None
+
     def vaccine_reminders_gui(self):
         try:
             today_date = date.today()
-            with self.session_scope() as session:
-                pets_due = session.query(self.Vaccine).filter(self.Vaccine.next_vaccine_date == today_date).all()
-                if not pets_due:
-                    reminders = self._("No vaccine reminders today.")
-                else:
-                    reminders_list = []
-                    for vac in pets_due:
-                        reminders_list.append(
-                            f"⚠ {vac.pet.pet_name} ({vac.pet.owner.user_name}) is due for vaccine {vac.vaccine_type} on {vac.next_vaccine_date.strftime('%Y-%m-%d')}"
-                        )
-                    reminders = "\n".join(reminders_list)
+            if self._reminders_date != today_date:
+                with self.session_scope() as session:
+                    pets_due = session.query(self.Vaccine).options(self.vaccine_owner_loader).filter(self.Vaccine.next_vaccine_date == today_date).all()
+                    self._reminders = [
+                        f"⚠ {vac.pet.pet_name} ({vac.pet.owner.user_name}) is due for vaccine {vac.vaccine_type} on {vac.next_vaccine_date:%Y-%m-%d}"
+                        for vac in pets_due
+                    ]
+                self._reminders_date = today_date
+            if not self._reminders:
+                reminders = self._("No vaccine reminders today.")
+            else:
+                reminders = "\n".join(self._reminders)
             QMessageBox.information(self.app, self._("Vaccine Reminders"), reminders)
         except Exception as e:
             show_error(self.app, self._("Error"), self._("Failed to retrieve reminders: ") + str(e))
 
     def search_records(self):
+        """Run the search box query; always re-queried, so changes made elsewhere show up."""
+        self._search_timer.stop()
+        self.show_records(query=self.search_entry.text().strip())
+
+    def _debounced_search(self):
         query = self.search_entry.text().strip()
+        if query == self._shown_query:
+            return  # The tree already shows this search.
         self.show_records(query=query)
 
     def view_vaccine_calendar(self):
@@ -602,23 +706,29 @@ class PatientManagementTab(QWidget):
             details = QtWidgets.QTextEdit()
             details.setReadOnly(True)
             layout.addWidget(details)
-            appointments = {}
-            with self.session_scope() as session:
-                vaccines = session.query(self.Vaccine).all()
-                for vac in vaccines:
-                    if vac.next_vaccine_date:
-                        d = QDate(vac.next_vaccine_date.year, vac.next_vaccine_date.month, vac.next_vaccine_date.day)
-                        appointments.setdefault(d, []).append(
-                            f"{vac.pet.pet_name} ({vac.pet.owner.user_name}) - {vac.vaccine_type}"
-                        )
-            from PyQt5.QtGui import QTextCharFormat
-            fmt = QTextCharFormat()
-            fmt.setBackground(QtCore.Qt.yellow)
-            for apt_date in appointments:
-                calendar.setDateTextFormat(apt_date, fmt)
+            if self._calendar_entries is None:
+                entries = {}
+                stmt = (
+                    select(self.Vaccine.next_vaccine_date, self.Vaccine.vaccine_type,
+                           self.Pet.pet_name, self.User.user_name)
+                    .join(self.Pet, self.Vaccine.pet_id == self.Pet.id)
+                    .join(self.User, self.Pet.owner_id == self.User.id)
+                    .where(self.Vaccine.next_vaccine_date.isnot(None))
+                )
+                with self.session_scope() as session:
+                    for next_date, vaccine_type, pet_name, owner_name in session.execute(stmt):
+                        entries.setdefault(next_date, []).append(f"{pet_name} ({owner_name}) - {vaccine_type}")
+                self._calendar_entries = entries
+            appointments = self._calendar_entries
+            calendar.setUpdatesEnabled(False)
+            try:
+                for apt_date in appointments:
+                    calendar.setDateTextFormat(QDate(apt_date), VACCINE_DUE_FORMAT)
+            finally:
+                calendar.setUpdatesEnabled(True)
+            calendar.updateCells()
             def update_details():
-                selected = calendar.selectedDate()
-                appts = appointments.get(selected, [])
+                appts = appointments.get(calendar.selectedDate().toPyDate())
                 if appts:
                     details.setPlainText("\n".join(appts))
                 else:
@@ -6,26 +6,53 @@ Environment variables (if set) override these defaults.
 A helper function is provided to fetch all settings as a dictionary.
 """
 
+import logging
 import os
+import re
 import sys
+from types import MappingProxyType, SimpleNamespace
+
+# Every setting below reads the environment through this one reference.
+_ENV = os.environ
+
+def _env_int(name, default):
+    """Reads an integer setting from the environment, falling back to default if it is not a number."""
+    value = _ENV.get(name)
+    if value is None:
+        return default
+    try:
+        return int(value)
+    except ValueError:
+        logging.getLogger(__name__).warning("Invalid %s value %r; using %d", name, value, default)
+        return default
 
 # Determine the base directory for resource files.
-if hasattr(sys, '_MEIPASS'):
+if getattr(sys, '_MEIPASS', None):
     BASE_DIR = os.path.dirname(sys.executable)
 else:
-    BASE_DIR = os.path.abspath(os.path.dirname(__file__))
+    # The import system already gives an absolute __file__, so no abspath() is needed.
+    BASE_DIR = os.path.dirname(__file__) or os.getcwd()
 
 # File paths for translations and configuration.
-TRANSLATIONS_FILE = os.environ.get('TRANSLATIONS_FILE', os.path.join(BASE_DIR, "translations.json"))
-CONFIG_FILE       = os.environ.get('CONFIG_FILE', os.path.join(BASE_DIR, "config.ini"))
+# The default paths are only joined when no override is set.
+TRANSLATIONS_FILE = _ENV.get('TRANSLATIONS_FILE')
+if TRANSLATIONS_FILE is None:
+    TRANSLATIONS_FILE = os.path.join(BASE_DIR, "translations.json")
+CONFIG_FILE = _ENV.get('CONFIG_FILE')
+if CONFIG_FILE is None:
+    CONFIG_FILE = os.path.join(BASE_DIR, "config.ini")
 
 # Database settings.
-DB_FILENAME = os.environ.get('DB_FILENAME', "vet_clinic.db")
-DB_URL = os.environ.get('DB_URL', f"sqlite:///{os.path.join(BASE_DIR, DB_FILENAME)}")
+DB_FILENAME = _ENV.get('DB_FILENAME', "vet_clinic.db")
+DB_URL = _ENV.get('DB_URL')
+if DB_URL is None:
+    DB_URL = "sqlite:///" + os.path.join(BASE_DIR, DB_FILENAME)
 
 # Default application appearance and language.
-DEFAULT_LANGUAGE = os.environ.get('DEFAULT_LANGUAGE', "ar")    # "ar" for Arabic, "en" for English.
-DEFAULT_THEME    = os.environ.get('DEFAULT_THEME', "default")
+# Values read from the environment are interned like the literal defaults, so comparisons
+# against them can short-circuit on identity.
+DEFAULT_LANGUAGE = sys.intern(_ENV.get('DEFAULT_LANGUAGE', "ar"))    # "ar" for Arabic, "en" for English.
+DEFAULT_THEME    = sys.intern(_ENV.get('DEFAULT_THEME', "default"))
 
 # Table names (if needed elsewhere).
 USERS_TABLE     = "users"
@@ -34,53 +61,45 @@ INVENTORY_TABLE = "inventory"
 
 # Regex pattern for phone number validation.
 PHONE_REGEX = r'^\+?\d{8,15}$'
+PHONE_REGEX_COMPILED = re.compile(PHONE_REGEX)
 
 # Window settings.
-WINDOW_TITLE    = os.environ.get('WINDOW_TITLE', "Vet Clinic Management System")
-WINDOW_GEOMETRY = os.environ.get('WINDOW_GEOMETRY', "1100x700")
-BG_COLOR        = os.environ.get('BG_COLOR', "#f4f6f8")
+WINDOW_TITLE    = _ENV.get('WINDOW_TITLE', "Vet Clinic Management System")
+WINDOW_GEOMETRY = _ENV.get('WINDOW_GEOMETRY', "1100x700")
+BG_COLOR        = _ENV.get('BG_COLOR', "#f4f6f8")
 
 # Logging settings.
-LOG_FORMAT = os.environ.get('LOG_FORMAT', "%(asctime)s [%(levelname)s] %(message)s")
-LOG_LEVEL  = os.environ.get('LOG_LEVEL', "INFO")
+LOG_FORMAT = _ENV.get('LOG_FORMAT', "%(asctime)s [%(levelname)s] %(message)s")
+LOG_LEVEL  = sys.intern(_ENV.get('LOG_LEVEL', "INFO"))
 
 # Additional settings.
-LOW_STOCK_THRESHOLD = int(os.environ.get('LOW_STOCK_THRESHOLD', 5))
-CURRENCY = os.environ.get('CURRENCY', "LE")
-BACKUP_FREQUENCY = os.environ.get('BACKUP_FREQUENCY', "7")  # in days.
+LOW_STOCK_THRESHOLD = _env_int('LOW_STOCK_THRESHOLD', 5)
+CURRENCY = _ENV.get('CURRENCY', "LE")
+BACKUP_FREQUENCY = _env_int('BACKUP_FREQUENCY', 7)  # in days.
+
+# Names of every setting above; get_all_settings and __all__ are built from this list.
+_SETTING_NAMES = (
+    "BASE_DIR", "TRANSLATIONS_FILE", "CONFIG_FILE", "DB_FILENAME", "DB_URL",
+    "DEFAULT_LANGUAGE", "DEFAULT_THEME", "USERS_TABLE", "PETS_TABLE",
+    "INVENTORY_TABLE", "PHONE_REGEX", "PHONE_REGEX_COMPILED", "WINDOW_TITLE",
+    "WINDOW_GEOMETRY", "BG_COLOR", "LOG_FORMAT", "LOG_LEVEL",
+    "LOW_STOCK_THRESHOLD", "CURRENCY", "BACKUP_FREQUENCY",
+)
+
+# Snapshot of every setting, built once; the values never change after import.
+_ALL_SETTINGS = MappingProxyType({name: globals()[name] for name in _SETTING_NAMES})
+
+# Attribute access to the same snapshot; SETTINGS.DB_URL is preferred over
+# get_all_settings()["DB_URL"] for single lookups.
+SETTINGS = SimpleNamespace(**_ALL_SETTINGS)
 
 def get_all_settings():
     """
-    Returns a dictionary of all configuration settings.
+    Returns a read-only mapping of all configuration settings.
     Environment variables override the built-in defaults.
+    The same snapshot is returned on every call.
     """
-    return {
-        "BASE_DIR": BASE_DIR,
-        "TRANSLATIONS_FILE": TRANSLATIONS_FILE,
-        "CONFIG_FILE": CONFIG_FILE,
-        "DB_FILENAME": DB_FILENAME,
-        "DB_URL": DB_URL,
-        "DEFAULT_LANGUAGE": DEFAULT_LANGUAGE,
-        "DEFAULT_THEME": DEFAULT_THEME,
-        "USERS_TABLE": USERS_TABLE,
-        "PETS_TABLE": PETS_TABLE,
-        "INVENTORY_TABLE": INVENTORY_TABLE,
-        "PHONE_REGEX": PHONE_REGEX,
-        "WINDOW_TITLE": WINDOW_TITLE,
-        "WINDOW_GEOMETRY": WINDOW_GEOMETRY,
-        "BG_COLOR": BG_COLOR,
-        "LOG_FORMAT": LOG_FORMAT,
-        "LOG_LEVEL": LOG_LEVEL,
-        "LOW_STOCK_THRESHOLD": LOW_STOCK_THRESHOLD,
-        "CURRENCY": CURRENCY,
-        "BACKUP_FREQUENCY": BACKUP_FREQUENCY
-    }
+    return _ALL_SETTINGS
 
 # Export a list of public objects.
-__all__ = [
-    "BASE_DIR", "TRANSLATIONS_FILE", "CONFIG_FILE", "DB_FILENAME", "DB_URL",
-    "DEFAULT_LANGUAGE", "DEFAULT_THEME", "USERS_TABLE", "PETS_TABLE",
-    "INVENTORY_TABLE", "PHONE_REGEX", "WINDOW_TITLE", "WINDOW_GEOMETRY",
-    "BG_COLOR", "LOG_FORMAT", "LOG_LEVEL", "LOW_STOCK_THRESHOLD", "CURRENCY",
-    "BACKUP_FREQUENCY", "get_all_settings"
-]
+__all__ = [*_SETTING_NAMES, "SETTINGS", "get_all_settings"]
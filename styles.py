@@ -5,6 +5,43 @@ This module defines common CSS style strings for the application.
 It includes a helper function to return style definitions based on the chosen theme.
 """
 
+from types import MappingProxyType
+
+# Declarations shared by several styles in both themes.
+_FS16 = "font-size: 16px;"
+_BR5 = "border-radius: 5px;"
+_BR8 = "border-radius: 8px;"
+_PAD = "padding: 10px 20px;"
+
+# Style definitions per theme, built once at import and shared read-only.
+_THEMES = {
+    # Default theme (light mode).
+    "default": MappingProxyType({
+        "TITLE_STYLE": "font-size: 26px; font-weight: bold; color: #2E8B57;",
+        "BUTTON_STYLE": f"{_PAD} {_FS16} background-color: #4682B4; color: white; border: none; {_BR5}",
+        "GROUPBOX_STYLE": f"background-color: #FFFFFF; border: 1px solid #dcdcdc; {_BR8} padding: 15px;",
+        "HEADER_LABEL_STYLE": "font-size: 18px; color: #333333;",
+        "LISTSTYLE": f"{_FS16} color: #333333;",
+        "PLACEHOLDER_STYLE": f"{_FS16} color: #555555; padding: 40px; border: 2px dashed #aaaaaa; {_BR8}"
+    }),
+    # Dark theme for low-light environments.
+    "dark": MappingProxyType({
+        "TITLE_STYLE": "font-size: 26px; font-weight: bold; color: #FFFFFF;",
+        "BUTTON_STYLE": f"{_PAD} {_FS16} background-color: #333333; color: #FFFFFF; border: none; {_BR5}",
+        "GROUPBOX_STYLE": f"background-color: #444444; border: 1px solid #666666; {_BR8} padding: 15px;",
+        "HEADER_LABEL_STYLE": "font-size: 18px; color: #DDDDDD;",
+        "LISTSTYLE": f"{_FS16} color: #DDDDDD;",
+        "PLACEHOLDER_STYLE": f"{_FS16} color: #AAAAAA; padding: 40px; border: 2px dashed #888888; {_BR8}"
+    }),
+}
+
+# Theme names in the casings callers use, so the common lookups need no lower() call.
+_THEME_DISPATCH = {
+    variant: styles
+    for name, styles in _THEMES.items()
+    for variant in (name, name.capitalize(), name.upper())
+}
+
 def get_theme_styles(theme="default"):
     """
     Returns a dictionary with style definitions for the specified theme.
@@ -17,30 +54,34 @@ def get_theme_styles(theme="default"):
         - "dark": Dark-themed styles for low-light environments.
     
     Returns:
-        dict: A dictionary containing style strings for various UI components.
+        Mapping: A read-only mapping containing style strings for various UI components.
+        Unknown theme names fall back to the default theme.
+    """
+    styles = _THEME_DISPATCH.get(theme)
+    if styles is None:
+        # Uncommon casing: normalize, then fall back to the default theme.
+        styles = _THEMES.get(theme.lower(), _THEMES["default"])
+    return styles
+
+def get_role_stylesheet(theme="default"):
+    """
+    Returns an application-wide stylesheet that applies the theme's styles to widgets by role,
+    so widgets tagged with setProperty("role", ...) share one parsed stylesheet.
+
+    Roles:
+        - "header": QLabel with HEADER_LABEL_STYLE.
+        - "group": QGroupBox with GROUPBOX_STYLE.
+        - "button": QPushButton with BUTTON_STYLE.
     """
-    if theme.lower() == "dark":
-        return {
-            "TITLE_STYLE": "font-size: 26px; font-weight: bold; color: #FFFFFF;",
-            "BUTTON_STYLE": "padding: 10px 20px; font-size: 16px; background-color: #333333; color: #FFFFFF; border: none; border-radius: 5px;",
-            "GROUPBOX_STYLE": "background-color: #444444; border: 1px solid #666666; border-radius: 8px; padding: 15px;",
-            "HEADER_LABEL_STYLE": "font-size: 18px; color: #DDDDDD;",
-            "LISTSTYLE": "font-size: 16px; color: #DDDDDD;",
-            "PLACEHOLDER_STYLE": "font-size: 16px; color: #AAAAAA; padding: 40px; border: 2px dashed #888888; border-radius: 8px;"
-        }
-    else:
-        # Default theme (light mode).
-        return {
-            "TITLE_STYLE": "font-size: 26px; font-weight: bold; color: #2E8B57;",
-            "BUTTON_STYLE": "padding: 10px 20px; font-size: 16px; background-color: #4682B4; color: white; border: none; border-radius: 5px;",
-            "GROUPBOX_STYLE": "background-color: #FFFFFF; border: 1px solid #dcdcdc; border-radius: 8px; padding: 15px;",
-            "HEADER_LABEL_STYLE": "font-size: 18px; color: #333333;",
-            "LISTSTYLE": "font-size: 16px; color: #333333;",
-            "PLACEHOLDER_STYLE": "font-size: 16px; color: #555555; padding: 40px; border: 2px dashed #aaaaaa; border-radius: 8px;"
-        }
+    styles = get_theme_styles(theme)
+    return (
+        f'QLabel[role="header"] {{ {styles["HEADER_LABEL_STYLE"]} }}\n'
+        f'QGroupBox[role="group"] {{ {styles["GROUPBOX_STYLE"]} }}\n'
+        f'QPushButton[role="button"] {{ {styles["BUTTON_STYLE"]} }}\n'
+    )
 
 # Export default styles based on the "default" theme.
-DEFAULT_STYLES = get_theme_styles("default")
+DEFAULT_STYLES = _THEMES["default"]
 
 # Export individual style constants for backward compatibility.
 TITLE_STYLE = DEFAULT_STYLES["TITLE_STYLE"]
@@ -49,8 +90,10 @@ GROUPBOX_STYLE = DEFAULT_STYLES["GROUPBOX_STYLE"]
 HEADER_LABEL_STYLE = DEFAULT_STYLES["HEADER_LABEL_STYLE"]
 LISTSTYLE = DEFAULT_STYLES["LISTSTYLE"]
 PLACEHOLDER_STYLE = DEFAULT_STYLES["PLACEHOLDER_STYLE"]
+ROLE_STYLESHEET = get_role_stylesheet("default")
 
 __all__ = [
     "get_theme_styles", "DEFAULT_STYLES", "TITLE_STYLE", "BUTTON_STYLE",
-    "GROUPBOX_STYLE", "HEADER_LABEL_STYLE", "LISTSTYLE", "PLACEHOLDER_STYLE"
+    "GROUPBOX_STYLE", "HEADER_LABEL_STYLE", "LISTSTYLE", "PLACEHOLDER_STYLE",
+    "get_role_stylesheet", "ROLE_STYLESHEET"
 ]